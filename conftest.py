@@ -51,18 +51,19 @@ IMPORT_FILES = {
     "datasource": DATASOURCE_IMPORT,
     "datasource_url": DATASOURCE_URL_IMPORT,
 }
+FIXTURE_TIMESTAMP = datetime.now()
 # ------------------------------------------------------------------------------------------------ #
 # collect_ignore_glob = ["*test_builder.py"]
 # ------------------------------------------------------------------------------------------------ #
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def location():
     return TEST_LOCATION
 
 
 # ------------------------------------------------------------------------------------------------ #
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def test_data():
     data = {}
     for name, filepath in IMPORT_FILES.items():
@@ -72,7 +73,7 @@ def test_data():
 
 
 # ------------------------------------------------------------------------------------------------ #
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def ratings():
     return IOService.read(RATINGS_FILEPATH)
 
@@ -171,37 +172,37 @@ def dataset(ratings):
 
 
 # ------------------------------------------------------------------------------------------------ #
-@pytest.fixture(scope="module")
-def profiles():
-    profiles = []
-    for i in range(1, 6):
-        profile = Profile(
-            name=f"profile_dto_{i}",
-            description=f"Description for Profile {i}",
-            start=datetime.now(),
-            end=datetime.now(),
-            duration=i + 1000,
-            user_cpu_time=i + 2000,
-            percent_cpu_used=i + 3000,
-            total_physical_memory=i + 4000,
-            physical_memory_available=i + 5000,
-            physical_memory_used=i + 6000,
-            percent_physical_memory_used=i + 7000,
-            active_memory_used=i + 8000,
-            disk_usage=i + 9000,
-            percent_disk_usage=i + 10000,
-            read_count=i + 11000,
-            write_count=i + 12000,
-            read_bytes=i + 13000,
-            write_bytes=i + 14000,
-            read_time=i + 15000,
-            write_time=i + 16000,
-            bytes_sent=i + 17000,
-            bytes_recv=i + 18000,
-            parent_oid=i * 20,
-        )
-        profiles.append(profile)
-    return profiles
+def _make_profile(i: int) -> Profile:
+    return Profile(
+        name=f"profile_dto_{i}",
+        description=f"Description for Profile {i}",
+        start=FIXTURE_TIMESTAMP,
+        end=FIXTURE_TIMESTAMP,
+        duration=i + 1000,
+        user_cpu_time=i + 2000,
+        percent_cpu_used=i + 3000,
+        total_physical_memory=i + 4000,
+        physical_memory_available=i + 5000,
+        physical_memory_used=i + 6000,
+        percent_physical_memory_used=i + 7000,
+        active_memory_used=i + 8000,
+        disk_usage=i + 9000,
+        percent_disk_usage=i + 10000,
+        read_count=i + 11000,
+        write_count=i + 12000,
+        read_bytes=i + 13000,
+        write_bytes=i + 14000,
+        read_time=i + 15000,
+        write_time=i + 16000,
+        bytes_sent=i + 17000,
+        bytes_recv=i + 18000,
+        parent_oid=i * 20,
+    )
+
+
+@pytest.fixture(scope="session", params=range(1, 6))
+def profile(request):
+    return _make_profile(request.param)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -296,25 +297,24 @@ def datasources():
 
 
 # ------------------------------------------------------------------------------------------------ #
-@pytest.fixture(scope="module")
-def dataframe_dicts():
-    """List of dictionaries that can be used to instantiate DataFrame."""
-    lod = []
-    for i in range(1, 6):
-        d = {
-            "name": f"dataframe_{i}",
-            "description": f"Description for DataFrame {i}",
-            "datasource": "movielens25m",
-            "stage": "interim",
-            "task_oid": i + i,
-        }
-        lod.append(d)
+def _make_dataframe_dict(i: int) -> dict:
+    return {
+        "name": f"dataframe_{i}",
+        "description": f"Description for DataFrame {i}",
+        "datasource": "movielens25m",
+        "stage": "interim",
+        "task_oid": i + i,
+    }
+
 
-    return lod
+@pytest.fixture(scope="session", params=range(1, 6))
+def dataframe_dict(request):
+    """Dictionary that can be used to instantiate DataFrame, one per parameter."""
+    return _make_dataframe_dict(request.param)
 
 
 # ------------------------------------------------------------------------------------------------ #
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def dag_config():
     """List of dictionaries that can be used to instantiate DataFrame."""
     return IOService.read(JOB_CONFIG_FILEPATH)
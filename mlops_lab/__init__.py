@@ -30,6 +30,7 @@ TRAIN_PROPORTION = 0.8
 #                                      DATA TYPES                                                  #
 # ------------------------------------------------------------------------------------------------ #
 IMMUTABLE_TYPES: tuple = (str, int, float, bool, type(None))
+IMMUTABLE_TYPE_SET: frozenset = frozenset(IMMUTABLE_TYPES)
 SEQUENCE_TYPES: tuple = (list, tuple)
 # ------------------------------------------------------------------------------------------------ #
 #                                      DATA SOURCES                                                #
@@ -17,106 +17,76 @@
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 """Main Module."""
+import logging
+
 from dependency_injector.wiring import Provide, inject
 from dependency_injector.providers import Factory
 
-from mlops_lab.core.dal.dba import DBA, ODBA
-from mlops_lab.container import mlops_lab
-
+from mlops_lab.core.database.relational import Database
+from mlops_lab.core.dal.dba import ODBA
+from mlops_lab.core.dal.sql.file import FileDDL
+from mlops_lab.core.dal.sql.datasource import DataSourceDDL
+from mlops_lab.core.dal.sql.datasource_url import DataSourceURLDDL
+from mlops_lab.core.dal.sql.dataframe import DataFrameDDL
+from mlops_lab.core.dal.sql.dataset import DatasetDDL
+from mlops_lab.core.dal.sql.event import EventDDL
+from mlops_lab.core.dal.sql.profile import ProfileDDL
+from mlops_lab.core.dal.sql.dag import DAGDDL
+from mlops_lab.core.dal.sql.task import TaskDDL
 
 # ------------------------------------------------------------------------------------------------ #
-@inject
-def reset_edb(dba=Provide[mlops_lab.dba.events_database]):
-    dba.reset()
-    assert dba.exists()
+RDB_TABLES = (FileDDL, DataSourceDDL, DataSourceURLDDL, DataFrameDDL, DatasetDDL)
+EDB_TABLES = (EventDDL, ProfileDDL, DAGDDL, TaskDDL)
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
 
 
 # ------------------------------------------------------------------------------------------------ #
 @inject
-def reset_rdb(dba=Provide[mlops_lab.dba.mlops_lab_database]):
+def reset_edb(dba=Provide["dba.events_database"]):
     dba.reset()
     assert dba.exists()
 
 
 # ------------------------------------------------------------------------------------------------ #
 @inject
-def reset_odb(dba=Provide[mlops_lab.dba.object]):
+def reset_rdb(dba=Provide["dba.mlops_lab_database"]):
     dba.reset()
     assert dba.exists()
 
 
 # ------------------------------------------------------------------------------------------------ #
 @inject
-def build_event_table(event_table: Factory[DBA] = Provide[mlops_lab.dba.event]) -> None:
-    event_table.create()
-    assert event_table.exists()
-
-
-# ------------------------------------------------------------------------------------------------ #
-@inject
-def build_file_table(file_table: Factory[DBA] = Provide[mlops_lab.dba.file]) -> None:
-    file_table.create()
-    assert file_table.exists()
+def reset_odb(dba=Provide["dba.object"]):
+    dba.reset()
+    assert dba.exists()
 
 
 # ------------------------------------------------------------------------------------------------ #
 @inject
-def build_datasource_table(
-    datasource_table: Factory[DBA] = Provide[mlops_lab.dba.datasource],
-) -> None:
-    datasource_table.create()
-    assert datasource_table.exists()
+def build_object_db(odb: Factory[ODBA] = Provide["dba.object"]) -> None:
+    odb.create()
+    assert odb.exists()
 
 
 # ------------------------------------------------------------------------------------------------ #
 @inject
-def build_datasource_url_table(
-    datasource_url_table: Factory[DBA] = Provide[mlops_lab.dba.datasource_url],
+def build_tables(
+    rdb: Database = Provide["database.rdb"],
+    edb: Database = Provide["database.edb"],
 ) -> None:
-    datasource_url_table.create()
-    assert datasource_url_table.exists()
-
-
-# ------------------------------------------------------------------------------------------------ #
-@inject
-def build_dataframe_table(dataframe_table: Factory[DBA] = Provide[mlops_lab.dba.dataframe]) -> None:
-    dataframe_table.create()
-    assert dataframe_table.exists()
-
-
-# ------------------------------------------------------------------------------------------------ #
-@inject
-def build_dataset_table(dataset_table: Factory[DBA] = Provide[mlops_lab.dba.dataset]) -> None:
-    dataset_table.create()
-    assert dataset_table.exists()
-
-
-# ------------------------------------------------------------------------------------------------ #
-@inject
-def build_dag_table(dag_table: Factory[DBA] = Provide[mlops_lab.dba.dag]) -> None:
-    dag_table.create()
-    assert dag_table.exists()
-
-
-# ------------------------------------------------------------------------------------------------ #
-@inject
-def build_task_table(task_table: Factory[DBA] = Provide[mlops_lab.dba.task]) -> None:
-    task_table.create()
-    assert task_table.exists()
-
-
-# ------------------------------------------------------------------------------------------------ #
-@inject
-def build_profile_table(profile_table: Factory[DBA] = Provide[mlops_lab.dba.profile]) -> None:
-    profile_table.create()
-    assert profile_table.exists()
-
-
-# ------------------------------------------------------------------------------------------------ #
-@inject
-def build_object_db(odb: Factory[ODBA] = Provide[mlops_lab.dba.object]) -> None:
-    odb.create()
-    assert odb.exists()
+    """Creates all relational tables, issuing each database's DDL over a single connection."""
+    for database, tables in ((rdb, RDB_TABLES), (edb, EDB_TABLES)):
+        database.connect()
+        try:
+            for ddl in tables:
+                database.create(sql=ddl.create.sql, args=ddl.create.args)
+                logger.info(ddl.create.description)
+            for ddl in tables:
+                assert database.exists(sql=ddl.exists.sql, args=ddl.exists.args)
+            database.save()
+        finally:
+            database.close()
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -128,30 +98,32 @@ def reset():
 
 # ------------------------------------------------------------------------------------------------ #
 def rebuild():
-    build_event_table()
-    build_profile_table()
-    build_file_table()
-    build_datasource_table()
-    build_datasource_url_table()
-    build_dataframe_table()
-    build_dataset_table()
-    build_dag_table()
-    build_task_table()
+    build_tables()
     build_object_db()
 
 
 # ------------------------------------------------------------------------------------------------ #
 def wireup():
-    mlops_lab = mlops_lab()
-    mlops_lab.core.init_resources()
-    mlops_lab.wire(modules=[__name__])
+    # Imported here so the container graph is only built when a command runs.
+    from mlops_lab.container import mlops_lab
+
+    container = mlops_lab()
+    container.core.init_resources()
+    container.wire(modules=[__name__])
+    return container
 
 
 # ------------------------------------------------------------------------------------------------ #
 def main():
-    wireup()
-    reset()
-    rebuild()
+    container = wireup()
+    # Resolve providers once and pass them explicitly rather than through Provide markers.
+    dba = container.dba
+    odba = dba.object()
+    reset_edb(dba.events_database())
+    reset_rdb(dba.mlops_lab_database())
+    reset_odb(odba)
+    build_tables(container.database.rdb(), container.database.edb())
+    build_object_db(odba)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -43,6 +43,8 @@ class mlops_lab(containers.DeclarativeContainer):
         ConnectionContainer,
         mlops_lab_database=config.databases.mlops_lab,
         events_database=config.databases.events,
+        pool_size=config.databases.pool_size,
+        pool_timeout=config.databases.pool_timeout,
     )
 
     database = providers.Container(
@@ -19,7 +19,8 @@
 """Data Layer Services associated with Database construction."""
 from abc import ABC, abstractmethod
 from collections import OrderedDict
-from typing import Dict, Tuple, List
+import copy
+from typing import Dict, Iterable, List, Set, Tuple
 import logging
 
 from mlops_lab.core.database.relational import Database
@@ -38,6 +39,8 @@ from mlops_lab.core.dal.dto import (
 from mlops_lab.core.dal.sql.base import DML
 from mlops_lab.core.entity.base import Entity
 
+# ------------------------------------------------------------------------------------------------ #
+CACHE_SIZE = 1024  # DataFrame DTOs cached per database, least recently read evicted first.
 
 # ------------------------------------------------------------------------------------------------ #
 #                                    BASE DATA ACCESS OBJECT                                       #
@@ -72,10 +75,46 @@ class DAO(ABC):
         """
         cmd = self._dml.insert(dto)
         dto.id = self._database.insert(cmd.sql, cmd.args)
-        msg = f"{self.__class__.__name__} inserted {self._entity.__name__}.{dto.id} - {dto.name} into database at {id(self._database)}."
-        self._logger.debug(msg)
+        self._logger.debug(
+            "%s inserted %s.%s - %s into database at %s.",
+            self.__class__.__name__,
+            self._entity.__name__,
+            dto.id,
+            dto.name,
+            id(self._database),
+        )
         return dto
 
+    def create_many(self, dtos: List[DTO]) -> List[DTO]:
+        """Adds several data transfer objects, committing once on autocommit databases.
+
+        Entities whose DML defines insert_batch are written with one multi-row INSERT, and their
+        ids read back by name. The ids of a multi-row INSERT need not be consecutive, e.g. under
+        auto_increment_increment > 1.
+
+        Args:
+            dtos (List[DTO]): Entity data transfer objects.
+
+        Returns: the dtos with their assigned ids
+        """
+        with self._database.transaction():
+            if self._dml.insert_batch is None or not dtos:
+                return [self.create(dto) for dto in dtos]
+            cmd = self._dml.insert_batch(dtos)
+            self._database.insert(cmd.sql, cmd.args)
+            cmd = self._dml.select_ids([dto.name for dto in dtos])
+            ids = dict(self._database.select_all(cmd.sql, cmd.args))
+            for dto in dtos:
+                dto.id = ids[dto.name]
+        self._logger.debug(
+            "%s inserted %s %s rows into database at %s.",
+            self.__class__.__name__,
+            len(dtos),
+            self._entity.__name__,
+            id(self._database),
+        )
+        return dtos
+
     def read(self, id: int) -> Entity:
         """Obtains an entity DTO with the designated id.
 
@@ -84,12 +123,8 @@ class DAO(ABC):
 
         Returns a DTO
         """
-        result = []
         cmd = self._dml.select(id)
-        row = self._database.select(cmd.sql, cmd.args)
-        if row is not None:
-            result = self._row_to_dto(row)
-        return result
+        return self._select_one(cmd.sql, cmd.args)
 
     def read_by_name(self, name: str) -> DTO:
         """Obtains an entity DTO with the designated name.
@@ -160,6 +195,21 @@ class DAO(ABC):
         result = self._database.exists(cmd.sql, cmd.args)
         return result
 
+    def exists_many(self, ids: Iterable[int]) -> Set[int]:
+        """Returns the subset of ids whose entities exist in the database.
+
+        Entities whose DML defines exists_many are checked with a single IN query.
+
+        Args:
+            ids (Iterable[int]): ids for the entities
+        """
+        ids = tuple(ids)
+        if self._dml.exists_many is None or not ids:
+            return {id for id in ids if self.exists(id)}
+        cmd = self._dml.exists_many(ids)
+        rows = self._database.select_all(cmd.sql, cmd.args) or ()
+        return {row[0] for row in rows}
+
     def delete(self, id: int, persist=True) -> None:
         """Deletes a Entity from the registry, given an id.
         Args:
@@ -183,6 +233,14 @@ class DAO(ABC):
         cmd = self._dml.load(filepath)
         self._database.load(cmd.sql, cmd.args)
 
+    def _select_one(self, sql: str, args: tuple) -> DTO:
+        """Runs a single-row select and returns its DTO, or an empty list if no row matched."""
+        result = []
+        row = self._database.select(sql, args)
+        if row is not None:
+            result = self._row_to_dto(row)
+        return result
+
     def _rows_to_dict(self, results: List) -> Dict:
         """Converts the results to a dictionary of DTO objects."""
         results_dict = OrderedDict()
@@ -200,8 +258,39 @@ class DAO(ABC):
 #                                 DATAFRAME DATA ACCESS OBJECT                                     #
 # ------------------------------------------------------------------------------------------------ #
 class DataFrameDAO(DAO):
+    """DataFrame Data Access Object
+
+    DataFrame metadata does not change between writes, so up to CACHE_SIZE DTOs read by id
+    outside a transaction are cached on the database, where every DataFrameDAO on it shares
+    them. Entries are evicted when a DAO updates or deletes the row, and the cache is cleared
+    whenever the database rolls back, loads or drops. Writes made through other connections
+    are not seen until then; existence checks always query.
+    """
+
     def __init__(self, dml: DML, database: Database) -> None:
         super().__init__(dml=dml, database=database)
+        self._cache = database.cache("dataframe")
+
+    def read(self, id: int) -> DataFrameDTO:
+        dto = self._cache.get(id)
+        if dto is None:
+            cmd = self._dml.select(id)
+            dto = self._select_one(cmd.sql, cmd.args)
+            if dto and not self._database.in_transaction:
+                self._cache[id] = dto
+                if len(self._cache) > CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(id)
+        return copy.copy(dto)
+
+    def update(self, dto: DataFrameDTO) -> int:
+        self._cache.pop(dto.id, None)
+        return super().update(dto)
+
+    def delete(self, id: int, persist=True) -> None:
+        self._cache.pop(id, None)
+        super().delete(id, persist)
 
     def _row_to_dto(self, row: Tuple) -> DataFrameDTO:
         try:
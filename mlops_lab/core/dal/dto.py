@@ -18,26 +18,26 @@
 # ================================================================================================ #
 from abc import ABC
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
-from mlops_lab import IMMUTABLE_TYPES, SEQUENCE_TYPES
+from mlops_lab import IMMUTABLE_TYPES, IMMUTABLE_TYPE_SET, SEQUENCE_TYPES
 
 
 # ------------------------------------------------------------------------------------------------ #
 #                              DATA TRANSFER OBJECT ABC                                            #
 # ------------------------------------------------------------------------------------------------ #
-@dataclass
+@dataclass(slots=True)
 class DTO(ABC):  # pragma: no cover
     """Data Transfer Object"""
 
     def as_dict(self) -> dict:
         """Returns a dictionary representation of the the Config object."""
-        return {k: self._export_config(v) for k, v in self.__dict__.items()}
+        return {f.name: self._export_config(getattr(self, f.name)) for f in fields(self)}
 
     @classmethod
     def _export_config(cls, v):
         """Returns v with Configs converted to dicts, recursively."""
-        if isinstance(v, IMMUTABLE_TYPES):
+        if type(v) in IMMUTABLE_TYPE_SET or isinstance(v, IMMUTABLE_TYPES):
             return v
         elif isinstance(v, SEQUENCE_TYPES):
             return type(v)(map(cls._export_config, v))
@@ -54,7 +54,7 @@ class DTO(ABC):  # pragma: no cover
 # ------------------------------------------------------------------------------------------------ #
 #                               PROFILE DATA TRANSFER OBJECT                                       #
 # ------------------------------------------------------------------------------------------------ #
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class ProfileDTO(DTO):
     id: int
     oid: str
@@ -98,7 +98,7 @@ class ProfileDTO(DTO):
 # ------------------------------------------------------------------------------------------------ #
 #                               DATASET DATA TRANSFER OBJECT                                       #
 # ------------------------------------------------------------------------------------------------ #
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class DataFrameDTO(DTO):
     id: int
     oid: str
@@ -132,7 +132,7 @@ class DataFrameDTO(DTO):
 # ------------------------------------------------------------------------------------------------ #
 #                               DATASETS DATA TRANSFER OBJECT                                      #
 # ------------------------------------------------------------------------------------------------ #
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class DatasetDTO(DTO):
     id: int
     oid: str
@@ -158,7 +158,7 @@ class DatasetDTO(DTO):
 # ------------------------------------------------------------------------------------------------ #
 #                                   JOB DATA TRANSFER OBJECT                                       #
 # ------------------------------------------------------------------------------------------------ #
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class DAGDTO(DTO):
     id: int
     oid: str
@@ -178,7 +178,7 @@ class DAGDTO(DTO):
 # ------------------------------------------------------------------------------------------------ #
 #                               TASK DATA TRANSFER OBJECT                                          #
 # ------------------------------------------------------------------------------------------------ #
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class TaskDTO(DTO):
     id: int
     oid: str
@@ -199,7 +199,7 @@ class TaskDTO(DTO):
 # ------------------------------------------------------------------------------------------------ #
 #                               FILE DATA TRANSFER OBJECT                                          #
 # ------------------------------------------------------------------------------------------------ #
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class FileDTO(DTO):
     id: int
     oid: str
@@ -223,7 +223,7 @@ class FileDTO(DTO):
 # ------------------------------------------------------------------------------------------------ #
 #                               DATA SOURCE TRANSFER OBJECT                                        #
 # ------------------------------------------------------------------------------------------------ #
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class DataSourceDTO(DTO):
     id: int
     oid: str
@@ -243,7 +243,7 @@ class DataSourceDTO(DTO):
 # ------------------------------------------------------------------------------------------------ #
 #                             DATA SOURCE URL TRANSFER OBJECT                                      #
 # ------------------------------------------------------------------------------------------------ #
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class DataSourceURLDTO(DTO):
     id: int
     oid: str
@@ -268,7 +268,7 @@ class DataSourceURLDTO(DTO):
 # ------------------------------------------------------------------------------------------------ #
 #                                EVENT DATA TRANSFER OBJECT                                        #
 # ------------------------------------------------------------------------------------------------ #
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class EventDTO(DTO):
     id: int
     oid: str
@@ -16,54 +16,70 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
-import os
-import dotenv
-
 from dataclasses import dataclass
-from mlops_lab.core.dal.sql.base import SQL, DDL, DML
-from mlops_lab.core.dal.dto import DTO
+from functools import lru_cache
+from itertools import chain
+from typing import Callable, ClassVar
+from mlops_lab.core.dal.sql.base import (
+    SQL,
+    DDL,
+    DML,
+    get_mode,
+    ids_by_name_sql,
+    multirow,
+    row_getter,
+    dto_columns,
+    writable_columns,
+    insert_sql,
+    update_sql,
+)
+from mlops_lab.core.dal.dto import DTO, DAGDTO
 from mlops_lab.core.entity.base import Entity
 from mlops_lab.core.workflow.dag import DAG
 
 # ================================================================================================ #
 #                                         JOB                                                      #
 # ================================================================================================ #
+# Selected columns in the positional order expected by the DAO row mapping.
+_DAG_COLUMNS = ", ".join(dto_columns(DAGDTO))
+# DTO attributes in insert/update column order; the update appends the id for its WHERE.
+_DAG_FIELDS = writable_columns(DAGDTO)
+_DAG_ROW = row_getter(*_DAG_FIELDS)
+_DAG_UPDATE_ROW = row_getter(*_DAG_FIELDS, "id")
 
 
 # ------------------------------------------------------------------------------------------------ #
 #                                          DDL                                                     #
 # ------------------------------------------------------------------------------------------------ #
-@dataclass
+@dataclass(slots=True)
 class CreateDAGTable(SQL):
     name: str = "dag"
-    sql: str = """CREATE TABLE IF NOT EXISTS dag (id MEDIUMINT PRIMARY KEY AUTO_INCREMENT, oid VARCHAR(255) NOT NULL, name VARCHAR(128) NOT NULL, description VARCHAR(255), state VARCHAR(32), created DATETIME DEFAULT CURRENT_TIMESTAMP, modified DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP, UNIQUE(name));"""
+    sql: ClassVar[str] = """CREATE TABLE IF NOT EXISTS dag (id MEDIUMINT PRIMARY KEY AUTO_INCREMENT, oid VARCHAR(255) NOT NULL, name VARCHAR(128) NOT NULL, description VARCHAR(255), state VARCHAR(32), created DATETIME DEFAULT CURRENT_TIMESTAMP, modified DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP, UNIQUE(name));"""
     args: tuple = ()
-    description: str = "Created the dag table."
+    description: ClassVar[str] = "Created the dag table."
 
 
 # ------------------------------------------------------------------------------------------------ #
-@dataclass
+@dataclass(slots=True)
 class DropDAGTable(SQL):
     name: str = "dag"
-    sql: str = """DROP TABLE IF EXISTS dag;"""
+    sql: ClassVar[str] = """DROP TABLE IF EXISTS dag;"""
     args: tuple = ()
-    description: str = "Dropped the dag table."
+    description: ClassVar[str] = "Dropped the dag table."
 
 
 # ------------------------------------------------------------------------------------------------ #
 
 
-@dataclass
+@dataclass(slots=True)
 class DAGTableExists(SQL):
     name: str = "dag"
-    sql: str = None
     args: tuple = ()
-    description: str = "Checked existence of dag table."
+    description: ClassVar[str] = "Checked existence of dag table."
 
-    def __post_init__(self) -> None:
-        dotenv.load_dotenv()
-        mode = os.getenv("MODE")
-        self.sql = f"""SELECT COUNT(TABLE_NAME) FROM information_schema.TABLES WHERE TABLE_SCHEMA LIKE 'mlops_lab_{mode}_events' AND TABLE_NAME = 'dag';"""
+    @property
+    def sql(self) -> str:
+        return f"""SELECT EXISTS(SELECT 1 FROM information_schema.TABLES WHERE TABLE_SCHEMA = 'mlops_lab_{get_mode()}_events' AND TABLE_NAME = 'dag');"""
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -80,61 +96,78 @@ class DAGDDL(DDL):
 # ------------------------------------------------------------------------------------------------ #
 
 
-@dataclass
+@dataclass(slots=True)
 class InsertDAG(SQL):
     dto: DTO
 
-    sql: str = """INSERT INTO dag (oid, name, description, state) VALUES (%s, %s, %s, %s);"""
+    sql: ClassVar[str] = insert_sql("dag", _DAG_FIELDS)
     args: tuple = ()
 
     def __post_init__(self) -> None:
-        self.args = (
-            self.dto.oid,
-            self.dto.name,
-            self.dto.description,
-            self.dto.state,
-        )
+        self.args = _DAG_ROW(self.dto)
 
 
 # ------------------------------------------------------------------------------------------------ #
 
 
-@dataclass
+@dataclass(slots=True)
+class InsertDAGBatch(SQL):
+    dtos: list
+    sql: str = None
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        self.sql = multirow(InsertDAG.sql, len(self.dtos))
+        self.args = tuple(chain.from_iterable(InsertDAG(dto).args for dto in self.dtos))
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+@dataclass(slots=True)
+class SelectDAGIds(SQL):
+    names: tuple
+    sql: str = None
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        self.sql = ids_by_name_sql("dag", len(self.names))
+        self.args = tuple(self.names)
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+@dataclass(slots=True)
 class UpdateDAG(SQL):
     dto: DTO
-    sql: str = """UPDATE dag SET oid = %s, name = %s, description = %s, state = %s WHERE id = %s;"""
+    sql: ClassVar[str] = update_sql("dag", _DAG_FIELDS)
     args: tuple = ()
 
     def __post_init__(self) -> None:
-        self.args = (
-            self.dto.oid,
-            self.dto.name,
-            self.dto.description,
-            self.dto.state,
-            self.dto.id,
-        )
+        self.args = _DAG_UPDATE_ROW(self.dto)
 
 
 # ------------------------------------------------------------------------------------------------ #
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SelectDAG(SQL):
     id: int
-    sql: str = """SELECT * FROM dag WHERE id = %s;"""
+    sql: ClassVar[str] = f"""SELECT {_DAG_COLUMNS} FROM dag WHERE id = %s;"""
     args: tuple = ()
 
     def __post_init__(self) -> None:
-        self.args = (self.id,)
+        object.__setattr__(self, "args", (self.id,))
 
 
 # ------------------------------------------------------------------------------------------------ #
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectDAGByName(SQL):
     name: str
-    sql: str = """SELECT * FROM dag WHERE name = %s;"""
+    sql: ClassVar[str] = f"""SELECT {_DAG_COLUMNS} FROM dag WHERE name = %s;"""
     args: tuple = ()
 
     def __post_init__(self) -> None:
@@ -144,38 +177,38 @@ class SelectDAGByName(SQL):
 # ------------------------------------------------------------------------------------------------ #
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectAllDAG(SQL):
-    sql: str = """SELECT * FROM dag;"""
+    sql: ClassVar[str] = f"""SELECT {_DAG_COLUMNS} FROM dag;"""
     args: tuple = ()
 
 
 # ------------------------------------------------------------------------------------------------ #
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DAGExists(SQL):
     id: int
-    sql: str = """SELECT EXISTS(SELECT 1 FROM dag WHERE id = %s LIMIT 1);"""
+    sql: ClassVar[str] = """SELECT EXISTS(SELECT 1 FROM dag WHERE id = %s LIMIT 1);"""
     args: tuple = ()
 
     def __post_init__(self) -> None:
-        self.args = (self.id,)
+        object.__setattr__(self, "args", (self.id,))
 
 
 # ------------------------------------------------------------------------------------------------ #
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeleteDAG(SQL):
     id: int
-    sql: str = """DELETE FROM dag WHERE id = %s;"""
+    sql: ClassVar[str] = """DELETE FROM dag WHERE id = %s;"""
     args: tuple = ()
 
     def __post_init__(self) -> None:
-        self.args = (self.id,)
+        object.__setattr__(self, "args", (self.id,))
 
 
 # ------------------------------------------------------------------------------------------------ #
-@dataclass
+@dataclass(slots=True)
 class LoadDAG(SQL):
     filename: str
     tablename: str = "dag"
@@ -186,15 +219,35 @@ class LoadDAG(SQL):
         self.sql = f"""LOAD DATA LOCAL INFILE '{self.filename}' INTO TABLE {self.tablename} FIELDS TERMINATED BY ',' ENCLOSED BY '"' LINES TERMINATED BY '\r\n' IGNORE 1 ROWS;"""
 
 
+# ------------------------------------------------------------------------------------------------ #
+#                        CACHED FACTORIES FOR THE FROZEN ID COMMANDS                               #
+# ------------------------------------------------------------------------------------------------ #
+@lru_cache(maxsize=4096)
+def select_dag(id: int) -> SelectDAG:
+    return SelectDAG(id)
+
+
+@lru_cache(maxsize=4096)
+def dag_exists(id: int) -> DAGExists:
+    return DAGExists(id)
+
+
+@lru_cache(maxsize=4096)
+def delete_dag(id: int) -> DeleteDAG:
+    return DeleteDAG(id)
+
+
 # ------------------------------------------------------------------------------------------------ #
 @dataclass
 class DAGDML(DML):
     entity: type[Entity] = DAG
     insert: type[SQL] = InsertDAG
+    insert_batch: type[SQL] = InsertDAGBatch
+    select_ids: type[SQL] = SelectDAGIds
     update: type[SQL] = UpdateDAG
-    select: type[SQL] = SelectDAG
+    select: Callable[..., SQL] = select_dag
     select_by_name: type[SQL] = SelectDAGByName
     select_all: type[SQL] = SelectAllDAG
-    exists: type[SQL] = DAGExists
-    delete: type[SQL] = DeleteDAG
+    exists: Callable[..., SQL] = dag_exists
+    delete: Callable[..., SQL] = delete_dag
     load: type[SQL] = LoadDAG
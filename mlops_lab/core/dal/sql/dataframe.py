@@ -16,54 +16,70 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
-import os
-import dotenv
-
 from dataclasses import dataclass
-from mlops_lab.core.dal.sql.base import SQL, DDL, DML
-from mlops_lab.core.dal.dto import DTO
+from functools import lru_cache
+from itertools import chain
+from typing import Callable, ClassVar
+from mlops_lab.core.dal.sql.base import (
+    SQL,
+    DDL,
+    DML,
+    get_mode,
+    ids_by_name_sql,
+    multirow,
+    row_getter,
+    dto_columns,
+    writable_columns,
+    insert_sql,
+    update_sql,
+)
+from mlops_lab.core.dal.dto import DTO, DataFrameDTO
 from mlops_lab.core.entity.base import Entity
 from mlops_lab.core.entity.dataset import DataFrame
 
 # ================================================================================================ #
-#                                        DATASET                                                   #
+#                                       DATAFRAME                                                  #
 # ================================================================================================ #
+# Selected columns in the positional order expected by the DAO row mapping.
+_DATAFRAME_COLUMNS = ", ".join(dto_columns(DataFrameDTO))
+# DTO attributes in insert/update column order; the update appends the id for its WHERE.
+_DATAFRAME_FIELDS = writable_columns(DataFrameDTO)
+_DATAFRAME_ROW = row_getter(*_DATAFRAME_FIELDS)
+_DATAFRAME_UPDATE_ROW = row_getter(*_DATAFRAME_FIELDS, "id")
 
 
 # ------------------------------------------------------------------------------------------------ #
 #                                          DDL                                                     #
 # ------------------------------------------------------------------------------------------------ #
-@dataclass
+@dataclass(slots=True)
 class CreateDataFrameTable(SQL):
     name: str = "dataframe"
-    sql: str = """CREATE TABLE IF NOT EXISTS dataframe (id MEDIUMINT PRIMARY KEY AUTO_INCREMENT, oid VARCHAR(255) NOT NULL, name VARCHAR(128) NOT NULL, description VARCHAR(255), stage VARCHAR(64) NOT NULL, size BIGINT, nrows BIGINT, ncols SMALLINT, nulls SMALLINT, pct_nulls FLOAT, dataset_oid VARCHAR(128) NOT NULL, created DATETIME DEFAULT CURRENT_TIMESTAMP, modified DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP, UNIQUE(name));"""
+    sql: ClassVar[str] = """CREATE TABLE IF NOT EXISTS dataframe (id MEDIUMINT PRIMARY KEY AUTO_INCREMENT, oid VARCHAR(255) NOT NULL, name VARCHAR(128) NOT NULL, description VARCHAR(255), stage VARCHAR(64) NOT NULL, size BIGINT, nrows BIGINT, ncols SMALLINT, nulls SMALLINT, pct_nulls FLOAT, dataset_oid VARCHAR(128) NOT NULL, created DATETIME DEFAULT CURRENT_TIMESTAMP, modified DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP, UNIQUE(name), INDEX idx_dataset_oid (dataset_oid));"""
     args: tuple = ()
-    description: str = "Created the dataframe table."
+    description: ClassVar[str] = "Created the dataframe table."
 
 
 # ------------------------------------------------------------------------------------------------ #
-@dataclass
+@dataclass(slots=True)
 class DropDataFrameTable(SQL):
     name: str = "dataframe"
-    sql: str = """DROP TABLE IF EXISTS dataframe;"""
+    sql: ClassVar[str] = """DROP TABLE IF EXISTS dataframe;"""
     args: tuple = ()
-    description: str = "Dropped the dataframe table."
+    description: ClassVar[str] = "Dropped the dataframe table."
 
 
 # ------------------------------------------------------------------------------------------------ #
 
 
-@dataclass
+@dataclass(slots=True)
 class DataFrameTableExists(SQL):
     name: str = "dataframe"
-    sql: str = None
     args: tuple = ()
-    description: str = "Checked existence of dataframe table."
+    description: ClassVar[str] = "Checked existence of dataframe table."
 
-    def __post_init__(self) -> None:
-        dotenv.load_dotenv()
-        mode = os.getenv("MODE")
-        self.sql = f"""SELECT COUNT(TABLE_NAME) FROM information_schema.TABLES WHERE TABLE_SCHEMA LIKE 'mlops_lab_{mode}' AND TABLE_NAME = 'dataframe';"""
+    @property
+    def sql(self) -> str:
+        return f"""SELECT EXISTS(SELECT 1 FROM information_schema.TABLES WHERE TABLE_SCHEMA = 'mlops_lab_{get_mode()}' AND TABLE_NAME = 'dataframe');"""
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -80,72 +96,77 @@ class DataFrameDDL(DDL):
 # ------------------------------------------------------------------------------------------------ #
 
 
-@dataclass
+@dataclass(slots=True)
 class InsertDataFrame(SQL):
     dto: DTO
-    sql: str = """INSERT INTO dataframe (oid, name, description, stage, size, nrows, ncols, nulls, pct_nulls, dataset_oid) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s);"""
+    sql: ClassVar[str] = insert_sql("dataframe", _DATAFRAME_FIELDS)
     args: tuple = ()
 
     def __post_init__(self) -> None:
-        self.args = (
-            self.dto.oid,
-            self.dto.name,
-            self.dto.description,
-            self.dto.stage,
-            self.dto.size,
-            self.dto.nrows,
-            self.dto.ncols,
-            self.dto.nulls,
-            self.dto.pct_nulls,
-            self.dto.dataset_oid,
-        )
+        self.args = _DATAFRAME_ROW(self.dto)
 
 
 # ------------------------------------------------------------------------------------------------ #
 
 
-@dataclass
+@dataclass(slots=True)
+class InsertDataFrameBatch(SQL):
+    dtos: list
+    sql: str = None
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        self.sql = multirow(InsertDataFrame.sql, len(self.dtos))
+        self.args = tuple(chain.from_iterable(InsertDataFrame(dto).args for dto in self.dtos))
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+@dataclass(slots=True)
+class SelectDataFrameIds(SQL):
+    names: tuple
+    sql: str = None
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        self.sql = ids_by_name_sql("dataframe", len(self.names))
+        self.args = tuple(self.names)
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+@dataclass(slots=True)
 class UpdateDataFrame(SQL):
     dto: DTO
-    sql: str = """UPDATE dataframe SET oid = %s, name = %s, description = %s, stage = %s, size = %s, nrows = %s, ncols = %s, nulls = %s, pct_nulls = %s, dataset_oid = %s WHERE id = %s;"""
+    sql: ClassVar[str] = update_sql("dataframe", _DATAFRAME_FIELDS)
     args: tuple = ()
 
     def __post_init__(self) -> None:
-        self.args = (
-            self.dto.oid,
-            self.dto.name,
-            self.dto.description,
-            self.dto.stage,
-            self.dto.size,
-            self.dto.nrows,
-            self.dto.ncols,
-            self.dto.nulls,
-            self.dto.pct_nulls,
-            self.dto.dataset_oid,
-            self.dto.id,
-        )
+        self.args = _DATAFRAME_UPDATE_ROW(self.dto)
 
 
 # ------------------------------------------------------------------------------------------------ #
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SelectDataFrame(SQL):
     id: int
-    sql: str = """SELECT * FROM dataframe WHERE id = %s;"""
+    sql: ClassVar[str] = f"""SELECT {_DATAFRAME_COLUMNS} FROM dataframe WHERE id = %s;"""
     args: tuple = ()
 
     def __post_init__(self) -> None:
-        self.args = (self.id,)
+        object.__setattr__(self, "args", (self.id,))
 
 
 # ------------------------------------------------------------------------------------------------ #
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectDataFrameByParentOid(SQL):
     dataset_oid: str
-    sql: str = """SELECT * FROM dataframe WHERE dataset_oid = %s;"""
+    sql: ClassVar[str] = f"""SELECT {_DATAFRAME_COLUMNS} FROM dataframe WHERE dataset_oid = %s;"""
     args: tuple = ()
 
     def __post_init__(self) -> None:
@@ -155,51 +176,51 @@ class SelectDataFrameByParentOid(SQL):
 # ------------------------------------------------------------------------------------------------ #
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectDataFrameByName(SQL):
     name: str
-    sql: str = """SELECT * FROM dataframe WHERE name = %s;"""
+    sql: ClassVar[str] = f"""SELECT {_DATAFRAME_COLUMNS} FROM dataframe WHERE name = %s;"""
     args: tuple = ()
 
     def __post_init__(self) -> None:
-        self.args = self.name
+        self.args = (self.name,)
 
 
 # ------------------------------------------------------------------------------------------------ #
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectAllDataset(SQL):
-    sql: str = """SELECT * FROM dataframe;"""
+    sql: ClassVar[str] = f"""SELECT {_DATAFRAME_COLUMNS} FROM dataframe;"""
     args: tuple = ()
 
 
 # ------------------------------------------------------------------------------------------------ #
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DataFrameExists(SQL):
     id: int
-    sql: str = """SELECT EXISTS(SELECT 1 FROM dataframe WHERE id = %s LIMIT 1);"""
+    sql: ClassVar[str] = """SELECT EXISTS(SELECT 1 FROM dataframe WHERE id = %s LIMIT 1);"""
     args: tuple = ()
 
     def __post_init__(self) -> None:
-        self.args = (self.id,)
+        object.__setattr__(self, "args", (self.id,))
 
 
 # ------------------------------------------------------------------------------------------------ #
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeleteDataFrame(SQL):
     id: int
-    sql: str = """DELETE FROM dataframe WHERE id = %s;"""
+    sql: ClassVar[str] = """DELETE FROM dataframe WHERE id = %s;"""
     args: tuple = ()
 
     def __post_init__(self) -> None:
-        self.args = (self.id,)
+        object.__setattr__(self, "args", (self.id,))
 
 
 # ------------------------------------------------------------------------------------------------ #
-@dataclass
+@dataclass(slots=True)
 class LoadDataFrame(SQL):
     filename: str
     tablename: str = "dataframe"
@@ -210,16 +231,36 @@ class LoadDataFrame(SQL):
         self.sql = f"""LOAD DATA LOCAL INFILE '{self.filename}' INTO TABLE {self.tablename} FIELDS TERMINATED BY ',' ENCLOSED BY '"' LINES TERMINATED BY '\r\n' IGNORE 1 ROWS;"""
 
 
+# ------------------------------------------------------------------------------------------------ #
+#                        CACHED FACTORIES FOR THE FROZEN ID COMMANDS                               #
+# ------------------------------------------------------------------------------------------------ #
+@lru_cache(maxsize=4096)
+def select_dataframe(id: int) -> SelectDataFrame:
+    return SelectDataFrame(id)
+
+
+@lru_cache(maxsize=4096)
+def dataframe_exists(id: int) -> DataFrameExists:
+    return DataFrameExists(id)
+
+
+@lru_cache(maxsize=4096)
+def delete_dataframe(id: int) -> DeleteDataFrame:
+    return DeleteDataFrame(id)
+
+
 # ------------------------------------------------------------------------------------------------ #
 @dataclass
 class DataFrameDML(DML):
     entity: type[Entity] = DataFrame
     insert: type[SQL] = InsertDataFrame
+    insert_batch: type[SQL] = InsertDataFrameBatch
+    select_ids: type[SQL] = SelectDataFrameIds
     update: type[SQL] = UpdateDataFrame
-    select: type[SQL] = SelectDataFrame
+    select: Callable[..., SQL] = select_dataframe
     select_by_name: type[SQL] = SelectDataFrameByName
-    select_by_dataset_id: type[SQL] = SelectDataFrameByParentOid
+    select_by_parent_oid: type[SQL] = SelectDataFrameByParentOid
     select_all: type[SQL] = SelectAllDataset
-    exists: type[SQL] = DataFrameExists
-    delete: type[SQL] = DeleteDataFrame
+    exists: Callable[..., SQL] = dataframe_exists
+    delete: Callable[..., SQL] = delete_dataframe
     load: type[SQL] = LoadDataFrame
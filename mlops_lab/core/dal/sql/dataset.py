@@ -16,18 +16,31 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
-import os
-import dotenv
-
 from dataclasses import dataclass
-from mlops_lab.core.dal.sql.base import SQL, DDL, DML
-from mlops_lab.core.dal.dto import DTO
+from mlops_lab.core.dal.sql.base import (
+    SQL,
+    DDL,
+    DML,
+    get_mode,
+    row_getter,
+    dto_columns,
+    writable_columns,
+    insert_sql,
+    update_sql,
+)
+from mlops_lab.core.dal.dto import DTO, DatasetDTO
 from mlops_lab.core.entity.base import Entity
 from mlops_lab.core.entity.dataset import Dataset
 
 # ================================================================================================ #
 #                                        DATASET                                                   #
 # ================================================================================================ #
+# Selected columns in the positional order expected by the DAO row mapping.
+_DATASET_COLUMNS = ", ".join(dto_columns(DatasetDTO))
+# DTO attributes in insert/update column order; the update appends the id for its WHERE.
+_DATASET_FIELDS = writable_columns(DatasetDTO)
+_DATASET_ROW = row_getter(*_DATASET_FIELDS)
+_DATASET_UPDATE_ROW = row_getter(*_DATASET_FIELDS, "id")
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -56,14 +69,12 @@ class DropDatasetTable(SQL):
 @dataclass
 class DatasetTableExists(SQL):
     name: str = "dataset"
-    sql: str = None
     args: tuple = ()
     description: str = "Checked existence of dataset table."
 
-    def __post_init__(self) -> None:
-        dotenv.load_dotenv()
-        mode = os.getenv("MODE")
-        self.sql = f"""SELECT COUNT(TABLE_NAME) FROM information_schema.TABLES WHERE TABLE_SCHEMA LIKE 'mlops_lab_{mode}' AND TABLE_NAME = 'dataset';"""
+    @property
+    def sql(self) -> str:
+        return f"""SELECT EXISTS(SELECT 1 FROM information_schema.TABLES WHERE TABLE_SCHEMA = 'mlops_lab_{get_mode()}' AND TABLE_NAME = 'dataset');"""
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -83,18 +94,11 @@ class DatasetDDL(DDL):
 @dataclass
 class InsertDataset(SQL):
     dto: DTO
-    sql: str = """INSERT INTO dataset (oid, name, description, datasource_oid, stage, task_oid) VALUES (%s, %s, %s, %s, %s, %s);"""
+    sql: str = insert_sql("dataset", _DATASET_FIELDS)
     args: tuple = ()
 
     def __post_init__(self) -> None:
-        self.args = (
-            self.dto.oid,
-            self.dto.name,
-            self.dto.description,
-            self.dto.datasource_oid,
-            self.dto.stage,
-            self.dto.task_oid,
-        )
+        self.args = _DATASET_ROW(self.dto)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -103,19 +107,11 @@ class InsertDataset(SQL):
 @dataclass
 class UpdateDataset(SQL):
     dto: DTO
-    sql: str = """UPDATE dataset SET oid = %s, name = %s, description = %s, datasource_oid = %s, stage = %s, task_oid = %s WHERE id = %s;"""
+    sql: str = update_sql("dataset", _DATASET_FIELDS)
     args: tuple = ()
 
     def __post_init__(self) -> None:
-        self.args = (
-            self.dto.oid,
-            self.dto.name,
-            self.dto.description,
-            self.dto.datasource_oid,
-            self.dto.stage,
-            self.dto.task_oid,
-            self.dto.id,
-        )
+        self.args = _DATASET_UPDATE_ROW(self.dto)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -124,7 +120,7 @@ class UpdateDataset(SQL):
 @dataclass
 class SelectDataset(SQL):
     id: int
-    sql: str = """SELECT * FROM dataset WHERE id = %s;"""
+    sql: str = f"""SELECT {_DATASET_COLUMNS} FROM dataset WHERE id = %s;"""
     args: tuple = ()
 
     def __post_init__(self) -> None:
@@ -137,7 +133,7 @@ class SelectDataset(SQL):
 @dataclass
 class SelectDatasetByName(SQL):
     name: str
-    sql: str = """SELECT * FROM dataset WHERE name = %s;"""
+    sql: str = f"""SELECT {_DATASET_COLUMNS} FROM dataset WHERE name = %s;"""
     args: tuple = ()
 
     def __post_init__(self) -> None:
@@ -149,7 +145,7 @@ class SelectDatasetByName(SQL):
 
 @dataclass
 class SelectAllDataset(SQL):
-    sql: str = """SELECT * FROM dataset;"""
+    sql: str = f"""SELECT {_DATASET_COLUMNS} FROM dataset;"""
     args: tuple = ()
 
 
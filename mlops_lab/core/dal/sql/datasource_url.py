@@ -16,11 +16,8 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
-import os
-import dotenv
-
 from dataclasses import dataclass
-from mlops_lab.core.dal.sql.base import SQL, DDL, DML
+from mlops_lab.core.dal.sql.base import SQL, DDL, DML, get_mode
 from mlops_lab.core.dal.dto import DTO
 from mlops_lab.core.entity.base import Entity
 from mlops_lab.core.entity.datasource import DataSourceURL
@@ -36,7 +33,7 @@ from mlops_lab.core.entity.datasource import DataSourceURL
 @dataclass
 class CreateDataSourceURLTable(SQL):
     name: str = "datasource_url"
-    sql: str = """CREATE TABLE IF NOT EXISTS datasource_url (id MEDIUMINT PRIMARY KEY AUTO_INCREMENT, oid VARCHAR(255) NOT NULL, name VARCHAR(128) NOT NULL, description VARCHAR(255), url VARCHAR(255) NOT NULL, datasource_oid VARCHAR(128) NOT NULL, created DATETIME DEFAULT CURRENT_TIMESTAMP, modified DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP, UNIQUE(name));"""
+    sql: str = """CREATE TABLE IF NOT EXISTS datasource_url (id MEDIUMINT PRIMARY KEY AUTO_INCREMENT, oid VARCHAR(255) NOT NULL, name VARCHAR(128) NOT NULL, description VARCHAR(255), url VARCHAR(255) NOT NULL, datasource_oid VARCHAR(128) NOT NULL, created DATETIME DEFAULT CURRENT_TIMESTAMP, modified DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP, UNIQUE(name), INDEX idx_datasource_oid (datasource_oid));"""
     args: tuple = ()
     description: str = "Created the datasource URL table."
 
@@ -56,14 +53,12 @@ class DropDataSourceURLTable(SQL):
 @dataclass
 class DataSourceURLTableExists(SQL):
     name: str = "datasource_url"
-    sql: str = None
     args: tuple = ()
     description: str = "Checked existence of datasource_url table."
 
-    def __post_init__(self) -> None:
-        dotenv.load_dotenv()
-        mode = os.getenv("MODE")
-        self.sql = f"""SELECT COUNT(TABLE_NAME) FROM information_schema.TABLES WHERE TABLE_SCHEMA LIKE 'mlops_lab_{mode}' AND TABLE_NAME = 'datasource_url';"""
+    @property
+    def sql(self) -> str:
+        return f"""SELECT EXISTS(SELECT 1 FROM information_schema.TABLES WHERE TABLE_SCHEMA = 'mlops_lab_{get_mode()}' AND TABLE_NAME = 'datasource_url');"""
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -16,56 +16,54 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
-import os
-import dotenv
 from dataclasses import dataclass
 
-from mlops_lab.core.dal.sql.base import SQL, DDL
+from mlops_lab.core.dal.sql.base import SQL, DDL, get_mode
 
 
 # ================================================================================================ #
 @dataclass
 class CreateDatabase(SQL):
     name: str = "mlops_lab"
-    sql: str = None
     args: tuple = ()
-    description: str = None
 
-    def __post_init__(self) -> None:
-        dotenv.load_dotenv()
-        mode = os.getenv("MODE")
-        self.sql = f"""CREATE DATABASE IF NOT EXISTS {self.name}_{mode}_events;"""
-        self.description = f"Created the mlops_lab_{mode}_events database."
+    @property
+    def sql(self) -> str:
+        return f"""CREATE DATABASE IF NOT EXISTS {self.name}_{get_mode()}_events;"""
+
+    @property
+    def description(self) -> str:
+        return f"Created the mlops_lab_{get_mode()}_events database."
 
 
 # ------------------------------------------------------------------------------------------------ #
 @dataclass
 class DropDatabase(SQL):
     name: str = "mlops_lab"
-    sql: str = None
     args: tuple = ()
-    description: str = None
 
-    def __post_init__(self) -> None:
-        dotenv.load_dotenv()
-        mode = os.getenv("MODE")
-        self.sql = f"""DROP DATABASE IF EXISTS {self.name}_{mode}_events;"""
-        self.description = f"Dropped the mlops_lab_{mode}_events database."
+    @property
+    def sql(self) -> str:
+        return f"""DROP DATABASE IF EXISTS {self.name}_{get_mode()}_events;"""
+
+    @property
+    def description(self) -> str:
+        return f"Dropped the mlops_lab_{get_mode()}_events database."
 
 
 # ------------------------------------------------------------------------------------------------ #
 @dataclass
 class DatabaseExists(SQL):
     name: str = "mlops_lab"
-    sql: str = None
     args: tuple = ()
-    description: str = None
 
-    def __post_init__(self) -> None:
-        dotenv.load_dotenv()
-        mode = os.getenv("MODE")
-        self.sql = f"""SELECT COUNT(*) FROM INFORMATION_SCHEMA.SCHEMATA WHERE SCHEMA_NAME = '{self.name}_{mode}_events';"""
-        self.description = f"Checked existence of the mlops_lab_{mode}_events database."
+    @property
+    def sql(self) -> str:
+        return f"""SELECT EXISTS(SELECT 1 FROM INFORMATION_SCHEMA.SCHEMATA WHERE SCHEMA_NAME = '{self.name}_{get_mode()}_events');"""
+
+    @property
+    def description(self) -> str:
+        return f"Checked existence of the mlops_lab_{get_mode()}_events database."
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -16,11 +16,10 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
-import os
-import dotenv
 from dataclasses import dataclass
+from itertools import chain
 
-from mlops_lab.core.dal.sql.base import SQL, DDL, DML
+from mlops_lab.core.dal.sql.base import SQL, DDL, DML, get_mode, ids_by_name_sql, multirow
 from mlops_lab.core.dal.dto import DTO
 from mlops_lab.core.entity.base import Entity
 from mlops_lab.core.entity.file import File
@@ -56,14 +55,12 @@ class DropFileTable(SQL):
 @dataclass
 class FileTableExists(SQL):
     name: str = "file"
-    sql: str = None
     args: tuple = ()
     description: str = "Checked existence of file table."
 
-    def __post_init__(self) -> None:
-        dotenv.load_dotenv()
-        mode = os.getenv("MODE")
-        self.sql = f"""SELECT COUNT(TABLE_NAME) FROM information_schema.TABLES WHERE TABLE_SCHEMA LIKE 'mlops_lab_{mode}' AND TABLE_NAME = 'file';"""
+    @property
+    def sql(self) -> str:
+        return f"""SELECT EXISTS(SELECT 1 FROM information_schema.TABLES WHERE TABLE_SCHEMA = 'mlops_lab_{get_mode()}' AND TABLE_NAME = 'file');"""
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -102,6 +99,34 @@ class InsertFile(SQL):
 # ------------------------------------------------------------------------------------------------ #
 
 
+@dataclass
+class InsertFileBatch(SQL):
+    dtos: list
+    sql: str = None
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        self.sql = multirow(InsertFile.sql, len(self.dtos))
+        self.args = tuple(chain.from_iterable(InsertFile(dto).args for dto in self.dtos))
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+@dataclass
+class SelectFileIds(SQL):
+    names: tuple
+    sql: str = None
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        self.sql = ids_by_name_sql("file", len(self.names))
+        self.args = tuple(self.names)
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
 @dataclass
 class UpdateFile(SQL):
     dto: DTO
@@ -170,6 +195,21 @@ class FileExists(SQL):
         self.args = (self.id,)
 
 
+# ------------------------------------------------------------------------------------------------ #
+
+
+@dataclass
+class FilesExist(SQL):
+    ids: tuple
+    sql: str = None
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        placeholders = ", ".join(["%s"] * len(self.ids))
+        self.sql = f"""SELECT id FROM file WHERE id IN ({placeholders});"""
+        self.args = tuple(self.ids)
+
+
 # ------------------------------------------------------------------------------------------------ #
 @dataclass
 class DeleteFile(SQL):
@@ -198,10 +238,13 @@ class LoadFile(SQL):
 class FileDML(DML):
     entity: type[Entity] = File
     insert: type[SQL] = InsertFile
+    insert_batch: type[SQL] = InsertFileBatch
+    select_ids: type[SQL] = SelectFileIds
     update: type[SQL] = UpdateFile
     select: type[SQL] = SelectFile
     select_by_name: type[SQL] = SelectFileByName
     select_all: type[SQL] = SelectAllFile
     exists: type[SQL] = FileExists
+    exists_many: type[SQL] = FilesExist
     delete: type[SQL] = DeleteFile
     load: type[SQL] = LoadFile
@@ -16,11 +16,8 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
-import os
-import dotenv
-
 from dataclasses import dataclass
-from mlops_lab.core.dal.sql.base import SQL, DDL, DML
+from mlops_lab.core.dal.sql.base import SQL, DDL, DML, get_mode
 from mlops_lab.core.dal.dto import DTO
 from mlops_lab.core.entity.base import Entity
 from mlops_lab.core.workflow.dag import Task
@@ -56,14 +53,12 @@ class DropTaskTable(SQL):
 @dataclass
 class TaskTableExists(SQL):
     name: str = "task"
-    sql: str = None
     args: tuple = ()
     description: str = "Checked existence of task table."
 
-    def __post_init__(self) -> None:
-        dotenv.load_dotenv()
-        mode = os.getenv("MODE")
-        self.sql = f"""SELECT COUNT(TABLE_NAME) FROM information_schema.TABLES WHERE TABLE_SCHEMA LIKE 'mlops_lab_{mode}_events' AND TABLE_NAME = 'task';"""
+    @property
+    def sql(self) -> str:
+        return f"""SELECT EXISTS(SELECT 1 FROM information_schema.TABLES WHERE TABLE_SCHEMA = 'mlops_lab_{get_mode()}_events' AND TABLE_NAME = 'task');"""
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -96,7 +96,7 @@ class Connection(ABC):
             self._connection.close()
             self._is_open = False
             self._in_transaction = False
-            self._logger.debug(f"{self.__class__.__name__}  {self._database} is closed.")
+            self._logger.debug("%s  %s is closed.", self.__class__.__name__, self._database)
         except mysql.connector.Error as err:  # pragma: no cover
             self._logger.error(err)
             raise mysql.connector.Error()
@@ -106,7 +106,7 @@ class Connection(ABC):
         try:
             self._connection.commit()
             self._in_transaction = False
-            self._logger.debug(f"{self.__class__.__name__} {self._database} is committed.")
+            self._logger.debug("%s %s is committed.", self.__class__.__name__, self._database)
         except mysql.connector.Error as err:  # pragma: no cover
             self._logger.error(err)
             raise mysql.connector.Error()
@@ -116,7 +116,7 @@ class Connection(ABC):
         try:
             self._connection.rollback()
             self._in_transaction = False
-            self._logger.debug(f"{self.__class__.__name__} {self._database} is rolled back.")
+            self._logger.debug("%s %s is rolled back.", self.__class__.__name__, self._database)
         except mysql.connector.Error as err:  # pragma: no cover
             self._logger.error(err)
             raise mysql.connector.Error()
@@ -23,6 +23,7 @@ from dependency_injector import containers, providers  # pragma: no cover
 
 from mlops_lab.core.database.relational import Database, MySQLConnection, DatabaseConnection
 from mlops_lab.core.database.object import ObjectDBConnection, ObjectDB
+from mlops_lab.core.database.pool import ConnectionPool
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -30,17 +31,38 @@ class ConnectionContainer(containers.DeclarativeContainer):
 
     mlops_lab_database = providers.Configuration()
     events_database = providers.Configuration()
+    pool_size = providers.Configuration()
+    pool_timeout = providers.Configuration()
 
     dbms_connection = providers.Factory(
         MySQLConnection, connector=pymysql.connect, autocommit=False, autoclose=False
     )
 
+    rdb_pool = providers.Singleton(
+        ConnectionPool,
+        connector=pymysql.connect,
+        database=mlops_lab_database,
+        size=pool_size,
+        timeout=pool_timeout,
+        autocommit=False,
+    )
+
+    edb_pool = providers.Singleton(
+        ConnectionPool,
+        connector=pymysql.connect,
+        database=events_database,
+        size=pool_size,
+        timeout=pool_timeout,
+        autocommit=True,
+    )
+
     rdb_connection = providers.Factory(
         DatabaseConnection,
         connector=pymysql.connect,
         database=mlops_lab_database,
         autocommit=False,
         autoclose=False,
+        pool=rdb_pool,
     )
 
     edb_connection = providers.Factory(
@@ -49,6 +71,7 @@ class ConnectionContainer(containers.DeclarativeContainer):
         database=events_database,
         autocommit=True,
         autoclose=False,
+        pool=edb_pool,
     )
 
     odb_connection = providers.Factory(
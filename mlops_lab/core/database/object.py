@@ -49,14 +49,13 @@ class Cursor:
 
     def open(self) -> None:
         os.makedirs(os.path.dirname(self._location), exist_ok=True)
-        self._cursor = shelve.open(self._location)
-        msg = f"Object storage opened at {self._location}"
-        self._logger.debug(msg)
+        # Pinned so shelves stay readable as newer interpreters raise HIGHEST_PROTOCOL.
+        self._cursor = shelve.open(self._location, protocol=5)
+        self._logger.debug("Object storage opened at %s", self._location)
 
     def close(self) -> None:
         self._cursor.close()
-        msg = f"Object storage at {self._location} is closed."
-        self._logger.debug(msg)
+        self._logger.debug("Object storage at %s is closed.", self._location)
 
     def drop(self) -> None:
         """Delete the cursor, i.e. the shelve database."""
@@ -113,8 +112,7 @@ class Cursor:
         self.open()
         exists = oid in self._cursor.keys()
         answer = "exists" if exists else "does not exist."
-        msg = f"Checked existence of {oid}. Entity {answer}."
-        self._logger.debug(msg)
+        self._logger.debug("Checked existence of %s. Entity %s.", oid, answer)
         self.close()
         return exists
 
@@ -181,8 +179,7 @@ class CacheCursor(Cursor):
         else:
             exists = False
         answer = "exists" if exists else "does not exist."
-        msg = f"Checked existence of {oid}. Entity {answer}."
-        self._logger.debug(msg)
+        self._logger.debug("Checked existence of %s. Entity %s.", oid, answer)
         self.close()
         return exists
 
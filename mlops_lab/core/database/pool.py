@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /mlops_lab/core/database/pool.py                                                    #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Thursday October 15th 2026 07:57:00 am                                              #
+# Modified   : Thursday October 15th 2026 07:57:00 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Database Connection Pool Module."""
+import os
+import queue
+import logging
+import threading
+from contextlib import contextmanager
+
+import dotenv
+import pymysql
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                     CONNECTION POOL                                              #
+# ------------------------------------------------------------------------------------------------ #
+class ConnectionPool:
+    """Bounded pool of reusable database connections.
+
+    Connections are created on demand up to size and recycled thereafter, so repeated
+    open/close cycles on a Database borrow an existing connection rather than establishing
+    a new one.
+
+    Args:
+        connector (pymysql.connect): Callable returning a DB-API connection.
+        database (str): Name of the database the pooled connections are bound to.
+        size (int): Maximum number of connections held by the pool.
+        timeout (float): Seconds to wait for a connection when the pool is exhausted, after which
+            TimeoutError is raised.
+        autocommit (bool): Autocommit mode applied to each pooled connection.
+    """
+
+    def __init__(
+        self,
+        connector: pymysql.connect,
+        database: str,
+        size: int = 5,
+        timeout: float = 30.0,
+        autocommit: bool = False,
+    ) -> None:
+        self._connector = connector
+        self._database = database
+        self._size = size
+        self._timeout = timeout
+        self._autocommit = autocommit
+        self._pool = queue.LifoQueue(maxsize=size)
+        self._created = 0
+        self._lock = threading.Lock()
+        dotenv.load_dotenv()
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def created(self) -> int:
+        """Returns the number of connections created by the pool."""
+        return self._created
+
+    def acquire(self) -> pymysql.connections.Connection:
+        """Borrows a connection from the pool, creating one if the pool has capacity."""
+        try:
+            connection = self._pool.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                reserved = self._created < self._size
+                if reserved:
+                    self._created += 1
+            if reserved:
+                try:
+                    return self._create()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            try:
+                connection = self._pool.get(timeout=self._timeout)
+            except queue.Empty:
+                msg = f"No connection to {self._database} was released within {self._timeout} seconds. All {self._size} pooled connections are checked out; a connection may not have been closed."
+                self._logger.error(msg)
+                raise TimeoutError(msg) from None
+        connection.ping(reconnect=True)
+        return connection
+
+    def release(self, connection: pymysql.connections.Connection) -> None:
+        """Returns a connection to the pool, discarding any uncommitted work."""
+        if not self._autocommit:
+            connection.rollback()
+        self._pool.put_nowait(connection)
+
+    @contextmanager
+    def get(self) -> pymysql.connections.Connection:
+        """Context manager that borrows a connection and returns it on exit."""
+        connection = self.acquire()
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def close(self) -> None:
+        """Closes all idle connections held by the pool."""
+        while True:
+            try:
+                connection = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            connection.close()
+            with self._lock:
+                self._created -= 1
+
+    def _create(self) -> pymysql.connections.Connection:
+        connection = self._connector(
+            host=os.getenv("DATABASE_HOST"),
+            user=os.getenv("DATABASE_USER"),
+            password=os.getenv("DATABASE_PASSWORD"),
+            database=self._database,
+            autocommit=self._autocommit,
+            local_infile=True,
+        )
+        self._logger.debug("Pool on %s created connection %s.", self._database, self._created)
+        return connection
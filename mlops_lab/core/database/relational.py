@@ -18,12 +18,16 @@
 # ================================================================================================ #
 """Relational Databases Module."""
 import os
+from collections import OrderedDict
+from contextlib import contextmanager
+
 import pymysql
 import dotenv
 import mysql.connector
 from mysql.connector import errorcode
 
 from .base import Connection, AbstractDatabase
+from .pool import ConnectionPool
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -53,7 +57,7 @@ class MySQLConnection(Connection):
                 host=host, user=user, password=password, autocommit=False
             )
             self._is_open = True
-            self._logger.debug(f"{self.__class__.__name__} is connected.")
+            self._logger.debug("%s is connected.", self.__class__.__name__)
         except mysql.connector.Error as err:  # pragma: no cover
             if err.errno == errorcode.ER_ACCESS_DENIED_ERROR:
                 msg = "Invalid user name or password"
@@ -80,14 +84,21 @@ class DatabaseConnection(Connection):
         database: str,
         autocommit: bool = False,
         autoclose: bool = False,
+        pool: ConnectionPool = None,
     ) -> None:
         super().__init__(connector=connector, autocommit=autocommit, autoclose=autoclose)
         self._database = database
+        self._pool = pool
         msg = f"Database connection on {self._database} is instantiated at {id(self._database)}."
         self._logger.debug(msg)
 
     def open(self) -> None:
-        """Opens a database connection."""
+        """Opens a database connection, borrowing from the pool if one is configured."""
+        if self._pool is not None:
+            self._connection = self._pool.acquire()
+            self._is_open = True
+            self._logger.debug("%s.%s acquired from pool.", self.__class__.__name__, self._database)
+            return
 
         dotenv.load_dotenv()
         host = os.getenv("DATABASE_HOST")
@@ -120,6 +131,17 @@ class DatabaseConnection(Connection):
                 self._logger.error(err)
                 raise mysql.connector.Error()
 
+    def close(self) -> None:
+        """Closes the connection, or returns it to the pool if one is configured."""
+        if self._pool is None:
+            super().close()
+            return
+        self._pool.release(self._connection)
+        self._connection = None
+        self._is_open = False
+        self._in_transaction = False
+        self._logger.debug("%s.%s released to pool.", self.__class__.__name__, self._database)
+
 
 # ------------------------------------------------------------------------------------------------ #
 #                                        DATABASE                                                  #
@@ -133,11 +155,25 @@ class Database(AbstractDatabase):
         self._is_open = self._connection.is_open
         self._database = self._connection.database
         self._in_transaction = False
+        self._generation = 0
+        self._caches = {}
 
     @property
     def database(self) -> str:
         return self._database
 
+    @property
+    def generation(self) -> int:
+        """Counts rollbacks, loads and drops, any of which invalidates rows read earlier."""
+        return self._generation
+
+    def cache(self, name: str) -> OrderedDict:
+        """Returns the named read cache shared by every DAO on this database.
+
+        Caches are cleared whenever the generation advances.
+        """
+        return self._caches.setdefault(name, OrderedDict())
+
     @property
     def in_transaction(self) -> bool:
         return self._in_transaction
@@ -158,6 +194,25 @@ class Database(AbstractDatabase):
         self._connection.begin()
         self._in_transaction = True
 
+    @contextmanager
+    def transaction(self) -> "Database":
+        """Groups statements into one explicit transaction that is committed once on exit.
+
+        Only autocommit connections need this; there it replaces a commit per statement with one.
+        Elsewhere the statements join the enclosing transaction, explicit or implicit, and are
+        committed or rolled back by the caller's save or rollback as before.
+        """
+        if self._in_transaction or not self._autocommit:
+            yield self
+            return
+        self.begin()
+        try:
+            yield self
+        except Exception:
+            self.rollback()
+            raise
+        self.save()
+
     def close(self) -> None:
         """Closes the underlying database connection."""
         if self._connection.is_open:
@@ -176,9 +231,14 @@ class Database(AbstractDatabase):
         if self._connection.is_open:
             self._connection.rollback()
         self._in_transaction = False
+        self._invalidate()
 
     def query(self, sql: str, args: tuple = None) -> Connection.cursor:
-        """Executes a query on the database and returns a cursor object."""
+        """Executes a query on the database and returns a cursor object.
+
+        PyMySQL escapes and interpolates args on the client and sends a single text-protocol
+        query, so there is no server-side prepare step to cache per statement.
+        """
         self._open_session()
         cursor = self._connection.cursor
         try:
@@ -197,6 +257,7 @@ class Database(AbstractDatabase):
         """Loads data into the database table."""
         cursor = self.query(sql, args)
         cursor.close()
+        self._invalidate()
 
     def create(self, sql: str, args: tuple = None) -> None:
         """Executes create DDL statements for databases and tables."""
@@ -249,6 +310,7 @@ class Database(AbstractDatabase):
         """Drop a database or table."""
         cursor = self.query(sql, args)
         cursor.close()
+        self._invalidate()
 
     def exists(self, sql: str, args: tuple = None) -> bool:
         """Returns True if the data specified by the parameters exists. Returns False otherwise."""
@@ -261,6 +323,12 @@ class Database(AbstractDatabase):
         except IndexError:  # pragma: no cover
             return False
 
+    def _invalidate(self) -> None:
+        """Advances the generation and clears the read caches."""
+        self._generation += 1
+        for cache in self._caches.values():
+            cache.clear()
+
     def _open_session(self) -> None:  # pragma: no cover
         """Opens a database connection if not already open."""
         if not self._is_open:
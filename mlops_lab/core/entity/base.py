@@ -19,6 +19,7 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 import logging
+from typing import Iterator, Tuple
 
 import mlops_lab
 from mlops_lab.core.service.validation import Validator
@@ -34,6 +35,14 @@ class Entity(ABC):
 
     """
 
+    __slots__ = ("_name", "_description", "_id", "_oid", "_created", "_modified", "_validator")
+    # Slots holding caches derived from other attributes, left out of as_dict.
+    _NON_EXPORTED = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._logger = logging.getLogger(f"{cls.__module__}.{cls.__name__}")
+
     def __init__(self, name: str, description: str = None) -> None:
         self._name = name
         self._description = description
@@ -42,9 +51,6 @@ class Entity(ABC):
         self._created = datetime.now()
         self._modified = datetime.now()
         self._validator = Validator()
-        self._logger = logging.getLogger(
-            f"{self.__module__}.{self.__class__.__name__}",
-        )
 
     @property
     def id(self) -> int:
@@ -79,13 +85,24 @@ class Entity(ABC):
         """Returns a dictionary representation of the the Config object."""
         return {
             k.replace("_", "", 1) if k[0] == "_" else k: self._export_config(v)
-            for k, v in self.__dict__.items()
+            for k, v in self._attributes()
         }
 
+    def _attributes(self) -> Iterator[Tuple[str, object]]:
+        """Yields instance attributes held in slots across the hierarchy, then any in __dict__.
+
+        Slots named in _NON_EXPORTED are skipped.
+        """
+        for klass in reversed(type(self).__mro__):
+            for name in klass.__dict__.get("__slots__", ()):
+                if name not in self._NON_EXPORTED and hasattr(self, name):
+                    yield name, getattr(self, name)
+        yield from getattr(self, "__dict__", {}).items()
+
     @classmethod
     def _export_config(cls, v):
         """Returns v with Configs converted to dicts, recursively."""
-        if isinstance(v, mlops_lab.IMMUTABLE_TYPES):
+        if type(v) in mlops_lab.IMMUTABLE_TYPE_SET or isinstance(v, mlops_lab.IMMUTABLE_TYPES):
             return v
         elif isinstance(v, mlops_lab.SEQUENCE_TYPES):
             return type(v)(map(cls._export_config, v))
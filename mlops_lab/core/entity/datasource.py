@@ -32,6 +32,8 @@ from mlops_lab.core.dal.dto import DataSourceURLDTO, DataSourceDTO
 class DataSourceComponent(Entity):
     """Base component class from which DataSourceURL (Leaf) and DataSource (Composite) objects derive."""
 
+    __slots__ = ()
+
     def __init__(self, name: str, description: str = None) -> None:
         super().__init__(name=name, description=description)
 
@@ -63,6 +65,9 @@ class DataSource(DataSourceComponent):
         website (str): The DataSource primary website
     """
 
+    __slots__ = ("_website", "_urls", "_is_composite", "_key", "_rendered")
+    _NON_EXPORTED = ("_key", "_rendered")
+
     def __init__(
         self,
         name: str,
@@ -76,28 +81,42 @@ class DataSource(DataSourceComponent):
         self._is_composite = True
 
         self._validate()
+        self._key = self._make_key()
+        self._rendered = None
 
     def __str__(self) -> str:
-        return f"DataSource Id: {self._id}\n\tName: {self._name}\n\tDescription: {self._description}\n\tWebsite: {self._website}\n\tCreated: {self._created}\n\tModified: {self._modified}"
+        if self._rendered is None:
+            self._rendered = "\n\t".join(
+                (
+                    f"DataSource Id: {self._id}",
+                    f"Name: {self._name}",
+                    f"Description: {self._description}",
+                    f"Website: {self._website}",
+                    f"Created: {self._created}",
+                    f"Modified: {self._modified}",
+                )
+            )
+        return self._rendered
 
     def __repr__(self) -> str:
         return f"{self._id}, {self._name}, {self._description}, {self._website}, {self._created}, {self._modified}"
 
     def __eq__(self, other: DataSourceComponent) -> bool:
-        if self.__class__.__name__ == other.__class__.__name__:
-            return (
-                self.is_composite == other.is_composite
-                and self.name == other.name
-                and self.description == other.description
-                and self.website == other.website
-            )
-        else:
-            return False
+        return isinstance(other, DataSource) and self._key == other._key
+
+    # Mutable, and the key changes with the website, so DataSources stay unhashable.
+    __hash__ = None
 
     @property
     def url_count(self) -> int:
         return len(self._urls)
 
+    # -------------------------------------------------------------------------------------------- #
+    @Entity.id.setter
+    def id(self, id: int) -> None:
+        Entity.id.fset(self, id)
+        self._rendered = None
+
     # -------------------------------------------------------------------------------------------- #
     @property
     def website(self) -> str:
@@ -107,6 +126,8 @@ class DataSource(DataSourceComponent):
     @website.setter
     def website(self, website: str) -> None:
         self._website = website
+        self._key = self._make_key()
+        self._rendered = None
 
     # -------------------------------------------------------------------------------------------- #
     @property
@@ -131,6 +152,7 @@ class DataSource(DataSourceComponent):
         url.datasource = self
         self._urls[url.name] = url
         self._modified = datetime.now()
+        self._rendered = None
 
     # -------------------------------------------------------------------------------------------- #
     def get_url(self, name) -> None:
@@ -153,11 +175,18 @@ class DataSource(DataSourceComponent):
     def update_url(self, url: DataSourceComponent) -> None:
         self._urls[url.name] = url
         self._modified = datetime.now()
+        self._rendered = None
 
     # -------------------------------------------------------------------------------------------- #
     def remove_url(self, name: str) -> None:
         del self._urls[name]
         self._modified = datetime.now()
+        self._rendered = None
+
+    # -------------------------------------------------------------------------------------------- #
+    def _make_key(self) -> tuple:
+        """Returns the tuple of fields that determine DataSource equality."""
+        return (self._name, self._description, self._website)
 
     # -------------------------------------------------------------------------------------------- #
     def as_dto(self) -> DataSourceDTO:
@@ -44,9 +44,11 @@ class DAGRepo(RepoABC):
         dto = self._dag_dao.create(entity.as_dto())
         entity.id = dto.id
 
-        for task in entity.tasks.values():
+        tasks = list(entity.tasks.values())
+        for task in tasks:
             task.dag = entity
-            dto = self._task_dao.create(dto=task.as_dto())
+        dtos = self._task_dao.create_many([task.as_dto() for task in tasks])
+        for task, dto in zip(tasks, dtos):
             task.id = dto.id
             entity.update_task(task)
 
@@ -45,9 +45,11 @@ class DatasetRepo(RepoABC):
         dto = self._dataset_dao.create(entity.as_dto())
         entity.id = dto.id
 
-        for name, dataframe in entity.dataframes.items():
+        dataframes = list(entity.dataframes.values())
+        for dataframe in dataframes:
             dataframe.parent = entity
-            dto = self._dataframe_dao.create(dto=dataframe.as_dto())
+        dtos = self._dataframe_dao.create_many([dataframe.as_dto() for dataframe in dataframes])
+        for dataframe, dto in zip(dataframes, dtos):
             dataframe.id = dto.id
             entity.update_dataframe(dataframe)
 
@@ -45,9 +45,11 @@ class DataSourceRepo(RepoABC):
         dto = self._datasource_dao.create(entity.as_dto())
         entity.id = dto.id
 
-        for datasource_url in entity.urls.values():
+        urls = list(entity.urls.values())
+        for datasource_url in urls:
             datasource_url.parent = entity
-            dto = self._datasource_url_dao.create(dto=datasource_url.as_dto())
+        dtos = self._datasource_url_dao.create_many([url.as_dto() for url in urls])
+        for datasource_url, dto in zip(urls, dtos):
             datasource_url.id = dto.id
             entity.update_url(datasource_url)
 
@@ -17,6 +17,8 @@
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 """Entity Repository. Serves as generic repository supporting basic CRUD functionality."""
+from typing import Iterable, List, Set
+
 import pandas as pd
 
 from mlops_lab.core.entity.base import Entity
@@ -47,6 +49,14 @@ class Repo(RepoABC):
         self._oao.create(entity)
         return entity
 
+    def add_many(self, entities: List[Entity]) -> List[Entity]:
+        """Adds several entities in a single database round trip and returns them with their ids."""
+        dtos = self._dao.create_many([entity.as_dto() for entity in entities])
+        for entity, dto in zip(entities, dtos):
+            entity.id = dto.id
+            self._oao.create(entity)
+        return entities
+
     def get(self, id: str) -> Entity:
         "Returns an entity with the designated id"
         entity = []
@@ -84,6 +94,10 @@ class Repo(RepoABC):
         """Returns True if entity with id exists in the repository."""
         return self._dao.exists(id)
 
+    def exists_many(self, ids: Iterable[int]) -> Set[int]:
+        """Returns the subset of ids whose entities exist in the repository."""
+        return self._dao.exists_many(ids)
+
     def print(self) -> None:
         """Prints the repository contents as a DataFrame."""
         df = pd.DataFrame()
@@ -116,16 +116,19 @@ class CSVIO(IO):
         header: Union[int, None] = 0,
         index_col: Union[int, str] = None,
         usecols: List[str] = None,
+        dtype: Union[str, dict] = None,
         low_memory: bool = False,
         encoding: str = "utf-8",
         **kwargs,
     ) -> pd.DataFrame:
-
+        # Declaring dtypes (e.g. int32 ids, float32 or category) lets the parser emit compact
+        # columns directly instead of inferring int64/object and converting afterwards.
         return pd.read_csv(
             filepath,
             header=header,
             index_col=index_col,
             usecols=usecols,
+            dtype=dtype,
             low_memory=low_memory,
             encoding=encoding,
         )
@@ -198,7 +201,10 @@ class PickleIO(IO):
         # use "ab+"
         with open(filepath, write_mode) as f:
             try:
-                pickle.dump(data, f)
+                # Protocol 5 hands numpy buffers to the file directly instead of copying each
+                # array into an intermediate bytes object first. It is pinned rather than
+                # HIGHEST_PROTOCOL so files stay readable as newer interpreters raise the default.
+                pickle.dump(data, f, protocol=5)
             except pickle.PickleError() as e:  # pragma: no cover
                 cls._logger.error(e)
                 raise (e)
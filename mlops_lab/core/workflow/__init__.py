@@ -20,3 +20,4 @@
 #                                         STATES                                                   #
 # ------------------------------------------------------------------------------------------------ #
 STATES = ["CREATED", "LOADED", "IN-PROGRESS", "FAILED", "COMPLETE"]
+CREATED, LOADED, IN_PROGRESS, FAILED, COMPLETE = STATES
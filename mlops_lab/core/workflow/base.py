@@ -18,15 +18,33 @@
 # ================================================================================================ #
 from abc import ABC, abstractmethod
 from datetime import datetime
+from functools import lru_cache, partialmethod
+from typing import Iterator
 import logging
 
 from dependency_injector.wiring import Provide, inject
 
 from mlops_lab.core.service.validation import Validator
 from mlops_lab.core.repo.container import EventRepoContainer
-from mlops_lab import IMMUTABLE_TYPES, SEQUENCE_TYPES
+from mlops_lab import IMMUTABLE_TYPES, IMMUTABLE_TYPE_SET, SEQUENCE_TYPES
 from mlops_lab.core.dal.dto import DTO
-from mlops_lab.core.workflow import STATES
+from mlops_lab.core.workflow import CREATED, LOADED, IN_PROGRESS, FAILED, COMPLETE
+
+# ------------------------------------------------------------------------------------------------ #
+# Exact types returned as-is by Process._export_config. Subclasses fall through to isinstance.
+_PASSTHROUGH_TYPES = IMMUTABLE_TYPE_SET | {datetime, dict}
+
+
+@lru_cache(maxsize=None)
+def _shared_validator() -> Validator:
+    """Returns the validator instance shared by all processes."""
+    return Validator()
+
+
+@lru_cache(maxsize=None)
+def _export_key(k: str) -> str:
+    """Strips the leading underscore from private attribute names."""
+    return k[1:] if k[0] == "_" else k
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -35,6 +53,11 @@ from mlops_lab.core.workflow import STATES
 class Process(ABC):
     """Base component class from which Task (Leaf) and DAG (Composite) objects derive."""
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._logger = logging.getLogger(f"{cls.__module__}.{cls.__name__}")
+        cls._oid_prefix = f"{cls.__name__.lower()}_"
+
     def __init__(
         self,
         name: str,
@@ -50,11 +73,7 @@ class Process(ABC):
         self._created = datetime.now()  # Overriden by autogenerated values on database tables
         self._modified = datetime.now()  # Overriden by autogenerated values on database tables
 
-        self._validator = Validator()
-
-        self._logger = logging.getLogger(
-            f"{self.__module__}.{self.__class__.__name__}",
-        )
+        self._validator = _shared_validator()
 
     # -------------------------------------------------------------------------------------------- #
     @property
@@ -108,70 +127,58 @@ class Process(ABC):
         """Creates a dto representation of the process."""
 
     # -------------------------------------------------------------------------------------------- #
-    def on_create(self) -> None:
-        self._state = STATES[0]
-        try:
-            self._callback.on_create(self)
-        except AttributeError:
-            msg = f"A Callback for {self.__class__.__name__} has not been set or is invalid."
-            self._logger.error(msg)
-            raise
-
-    # -------------------------------------------------------------------------------------------- #
-    def on_load(self) -> None:
-        self._state = STATES[1]
-        try:
-            self._callback.on_load(self)
-        except AttributeError:
-            msg = f"A Callback for {self.__class__.__name__} has not been set or is invalid."
-            self._logger.error(msg)
-            raise
-
-    # -------------------------------------------------------------------------------------------- #
-    def on_start(self) -> None:
-        self._state = STATES[2]
-        try:
-            self._callback.on_start(self)
-        except AttributeError:
-            msg = f"A Callback for {self.__class__.__name__} has not been set or is invalid."
-            self._logger.error(msg)
-            raise
-
-    # -------------------------------------------------------------------------------------------- #
-    def on_fail(self) -> None:
-        self._state = STATES[3]
-        try:
-            self._callback.on_fail(self)
-        except AttributeError:
-            msg = f"A Callback for {self.__class__.__name__} has not been set or is invalid."
+    def _transition(self, state: str) -> None:
+        """Sets the process state and notifies the callback of the state change."""
+        self._state = state
+        callback = self._callback
+        if callback is None:
+            msg = f"A Callback for {self.__class__.__name__} has not been set."
             self._logger.error(msg)
-            raise
+            raise TypeError(msg)
+        callback.on_event(state, self)
 
-    # -------------------------------------------------------------------------------------------- #
-    def on_end(self) -> None:
-        self._state = STATES[4]
-        try:
-            self._callback.on_end(self)
-        except AttributeError:
-            msg = f"A Callback for {self.__class__.__name__} has not been set or is invalid."
-            self._logger.error(msg)
-            raise
+    on_create = partialmethod(_transition, CREATED)
+    on_load = partialmethod(_transition, LOADED)
+    on_start = partialmethod(_transition, IN_PROGRESS)
+    on_fail = partialmethod(_transition, FAILED)
+    on_end = partialmethod(_transition, COMPLETE)
 
     # -------------------------------------------------------------------------------------------- #
     def as_dict(self) -> dict:
         """Returns a dictionary representation of the the Config object."""
-        return {
-            k.replace("_", "", 1) if k[0] == "_" else k: self._export_config(v)
-            for k, v in self.__dict__.items()
-        }
+        return {_export_key(k): self._export_config(v) for k, v in self.__dict__.items()}
 
     @classmethod
-    def _export_config(cls, v):
-        """Returns v with Configs converted to dicts, recursively."""
-        if isinstance(v, IMMUTABLE_TYPES):
+    def _export_config(cls, v: object) -> object:
+        """Returns v with Configs converted to dicts. Nested sequences are walked iteratively."""
+        if not isinstance(v, SEQUENCE_TYPES):
+            return cls._export_item(v)
+
+        result = None
+        stack: list[tuple[Iterator, list, type]] = [(iter(v), [], type(v))]
+        while stack:
+            items, exported, kind = stack[-1]
+            for item in items:
+                if isinstance(item, SEQUENCE_TYPES):
+                    stack.append((iter(item), [], type(item)))
+                    break
+                exported.append(cls._export_item(item))
+            else:
+                stack.pop()
+                sequence = kind(exported)
+                if stack:
+                    stack[-1][1].append(sequence)
+                else:
+                    result = sequence
+        return result
+
+    @classmethod
+    def _export_item(cls, v: object) -> object:
+        """Returns a non-sequence value with Configs converted to dicts."""
+        if type(v) in _PASSTHROUGH_TYPES:
+            return v
+        elif isinstance(v, IMMUTABLE_TYPES):
             return v
-        elif isinstance(v, SEQUENCE_TYPES):
-            return type(v)(map(cls._export_config, v))
         elif isinstance(v, datetime):
             return v
         elif isinstance(v, dict):
@@ -183,7 +190,7 @@ class Process(ABC):
 
     # -------------------------------------------------------------------------------------------- #
     def _get_oid(self) -> str:
-        return f"{self.__class__.__name__.lower()}_{self._name}"
+        return self._oid_prefix + self._name
 
     # -------------------------------------------------------------------------------------------- #
     def _validate(self) -> None:
@@ -202,44 +209,19 @@ class Callback(ABC):
     @inject
     def __init__(self, events: EventRepoContainer = Provide[EventRepoContainer]) -> None:
         self._events = events
+        self._name = self.__class__.__name__.lower()
 
     @property
     def name(self) -> str:
-        """Returns the callback name or lowercase class name if none provided."""
-        self._name = self._name or self.__class__.__name__.lower()
-
-    @abstractmethod
-    def on_create(self, process: Process) -> None:
-        """Called at process (dag, task) creation
-
-        Args:
-            process (Process): Process object representation of the process being created.
-
-        """
-
-    @abstractmethod
-    def on_start(self, process: Process) -> None:
-        """Called when a process (dag, task) begins execution.
-
-        Args:
-            process (Process): Process object representation of the process which has started.
-
-        """
-
-    @abstractmethod
-    def on_fail(self, process: Process) -> None:
-        """Called at process (dag, task) ends either successfully or otherwise.
-
-        Args:
-            process (Process): Process object representation of the process which has ended.
-
-        """
+        """Returns the callback name, the lowercase class name."""
+        return self._name
 
     @abstractmethod
-    def on_end(self, process: Process) -> None:
-        """Called at process (dag, task) ends either successfully or otherwise.
+    def on_event(self, state: str, process: Process) -> None:
+        """Called each time a process (dag, task) changes state.
 
         Args:
-            process (Process): Process object representation of the process which has ended.
+            state (str): The state the process has entered. One of STATES.
+            process (Process): Process object representation of the process.
 
         """
@@ -20,7 +20,31 @@
 
 from mlops_lab.core.workflow.base import Callback, Process
 from mlops_lab.core.workflow.event import Event
-from mlops_lab.core.workflow import STATES
+from mlops_lab.core.workflow import CREATED, LOADED, IN_PROGRESS, FAILED, COMPLETE
+
+# ------------------------------------------------------------------------------------------------ #
+# Event name and description templates for each state a process may enter.
+EVENT_TEMPLATES = {
+    CREATED: ("created_{}", "Created {}"),
+    LOADED: ("loaded_{}", "Loaded {}"),
+    IN_PROGRESS: ("started_{}", "Started {}"),
+    FAILED: ("{}_failed.", "{}FAILED"),
+    COMPLETE: ("ended_{}", "Ended {}"),
+}
+
+
+# ------------------------------------------------------------------------------------------------ #
+def create_event(state: str, process: Process, parent_oid: str = None) -> Event:
+    """Creates the Event published when a process enters the designated state."""
+    name, description = EVENT_TEMPLATES[state]
+    return Event(
+        name=name.format(process.name),
+        description=description.format(process.description),
+        state=state,
+        process_type=process.__class__.__name__,
+        process_oid=process.oid,
+        parent_oid=parent_oid,
+    )
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -33,100 +57,19 @@ class DAGCallback(Callback):
         super().__init__()
 
     # -------------------------------------------------------------------------------------------- #
-    def on_create(self, process: Process) -> None:
-        """Called at process (dag, task) creation
-
-        Args:
-            process (Process): Process object representation of the process being created.
-
-        """
-        event = Event(
-            name="created_" + process.name,
-            description="Created " + process.description,
-            state=STATES[0],
-            process_type=process.__class__.__name__,
-            process_oid=process.oid,
-            parent_oid=None,
-        )
-        self._events.dag().add(entity=process)
-        self._events.event().add(event)
-
-    # -------------------------------------------------------------------------------------------- #
-    def on_load(self, process: Process) -> None:
-        """Called at process (dag, task) creation
-
-        May be overriden if this has utility.
-
-        Args:
-            process (Process): Process object representation of the process being created.
-
-        """
-        event = Event(
-            name="loaded_" + process.name,
-            description="Loaded " + process.description,
-            state=STATES[1],
-            process_type=process.__class__.__name__,
-            process_oid=process.oid,
-            parent_oid=None,
-        )
-        self._events.dag().update(entity=process)
-        self._events.event().add(event)
-
-    # -------------------------------------------------------------------------------------------- #
-    def on_start(self, process: Process) -> None:
-        """Called when a process (dag, task) begins execution.
-
-        Args:
-            process (Process): Process object representation of the process which has started.
-
-        """
-        event = Event(
-            name="started_" + process.name,
-            description="Started " + process.description,
-            state=STATES[2],
-            process_type=process.__class__.__name__,
-            process_oid=process.oid,
-            parent_oid=None,
-        )
-        self._events.dag().update(entity=process)
-        self._events.event().add(event)
-
-    # -------------------------------------------------------------------------------------------- #
-    def on_fail(self, process: Process) -> None:
-        """Called at process (dag, task) ends either successfully or otherwise.
+    def on_event(self, state: str, process: Process) -> None:
+        """Persists the dag and publishes an event each time the dag changes state.
 
         Args:
-            process (Process): Process object representation of the process which has ended.
+            state (str): The state the dag has entered.
+            process (Process): The dag which changed state.
 
         """
-        event = Event(
-            name=process.name + "_failed.",
-            description=process.description + "FAILED",
-            state=STATES[3],
-            process_type=process.__class__.__name__,
-            process_oid=process.oid,
-            parent_oid=None,
-        )
-        self._events.dag().update(entity=process)
-        self._events.event().add(event)
-
-    # -------------------------------------------------------------------------------------------- #
-    def on_end(self, process: Process) -> None:
-        """Called at process (dag, task) ends either successfully or otherwise.
-
-        Args:
-            process (Process): Process object representation of the process which has ended.
-
-        """
-        event = Event(
-            name="ended_" + process.name,
-            description="Ended " + process.description,
-            state=STATES[4],
-            process_type=process.__class__.__name__,
-            process_oid=process.oid,
-            parent_oid=None,
-        )
-        self._events.dag().update(entity=process)
+        event = create_event(state=state, process=process)
+        if state == CREATED:
+            self._events.dag().add(entity=process)
+        else:
+            self._events.dag().update(entity=process)
         self._events.event().add(event)
 
 
@@ -144,93 +87,17 @@ class TaskCallback(Callback):
         super().__init__()
 
     # -------------------------------------------------------------------------------------------- #
-    def on_create(self, process: Process) -> None:
-        """Called at process (dag, task) creation
-
-        Args:
-            process (Process): Process object representation of the process being created.
-
-        """
-        event = Event(
-            name="created_" + process.name,
-            description="Created " + process.description,
-            process_type=process.__class__.__name__,
-            process_oid=process.oid,
-            parent_oid=process.parent.oid,
-        )
-        self._events.task().add(entity=process)
-        self._events.event().add(event)
-
-    # -------------------------------------------------------------------------------------------- #
-    def on_load(self, process: Process) -> None:
-        """Called at process (dag, task) creation
-
-        May be overriden if this has utility.
-
-        Args:
-            process (Process): Process object representation of the process being created.
-
-        """
-        event = Event(
-            name="loaded_" + process.name,
-            description="Loaded " + process.description,
-            process_type=process.__class__.__name__,
-            process_oid=process.oid,
-            parent_oid=process.parent.oid,
-        )
-        self._events.task().update(entity=process)
-        self._events.event().add(event)
-
-    # -------------------------------------------------------------------------------------------- #
-    def on_start(self, process: Process) -> None:
-        """Called when a process (dag, task) begins execution.
-
-        Args:
-            process (Process): Process object representation of the process which has started.
-
-        """
-        event = Event(
-            name="started_" + process.name,
-            description="Started " + process.description,
-            process_type=process.__class__.__name__,
-            process_oid=process.oid,
-            parent_oid=process.parent.oid,
-        )
-        self._events.task().update(entity=process)
-        self._events.event().add(event)
-
-    # -------------------------------------------------------------------------------------------- #
-    def on_fail(self, process: Process) -> None:
-        """Called at process (dag, task) ends either successfully or otherwise.
-
-        Args:
-            process (Process): Process object representation of the process which has ended.
-
-        """
-        event = Event(
-            name=process.name + "_failed.",
-            description=process.description + "FAILED",
-            process_type=process.__class__.__name__,
-            process_oid=process.oid,
-            parent_oid=process.parent.oid,
-        )
-        self._events.task().update(entity=process)
-        self._events.event().add(event)
-
-    # -------------------------------------------------------------------------------------------- #
-    def on_end(self, process: Process) -> None:
-        """Called at process (dag, task) ends either successfully or otherwise.
+    def on_event(self, state: str, process: Process) -> None:
+        """Persists the task and publishes an event each time the task changes state.
 
         Args:
-            process (Process): Process object representation of the process which has ended.
+            state (str): The state the task has entered.
+            process (Process): The task which changed state.
 
         """
-        event = Event(
-            name="ended_" + process.name,
-            description="Ended " + process.description,
-            process_type=process.__class__.__name__,
-            process_oid=process.oid,
-            parent_oid=process.parent.oid,
-        )
-        self._events.task().update(entity=process)
+        event = create_event(state=state, process=process, parent_oid=process.dag.oid)
+        if state == CREATED:
+            self._events.task().add(entity=process)
+        else:
+            self._events.task().update(entity=process)
         self._events.event().add(event)
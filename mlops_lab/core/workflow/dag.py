@@ -37,7 +37,7 @@
 """Process Module"""
 import pandas as pd
 from datetime import datetime
-from collections import OrderedDict
+from typing import Any, Optional, Tuple
 
 
 from dependency_injector.wiring import Provide, inject
@@ -46,8 +46,9 @@ from mlops_lab.core.workflow.base import Process
 from mlops_lab.core.workflow.callback import Callback
 from mlops_lab.core.workflow.container import CallbackContainer
 from mlops_lab.core.workflow.operator.base import Operator
+from mlops_lab.core.repo.uow import UnitOfWork
 from mlops_lab.core.dal.dao import DTO, DAGDTO, TaskDTO
-from mlops_lab.core.workflow import STATES
+from mlops_lab.core.workflow import CREATED
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -71,9 +72,12 @@ class DAG(Process):
         super().__init__(name=name, description=description)
         self._callback = callback
 
-        self._tasks = OrderedDict()
+        # Plain dicts keep insertion order, so tasks still run in the order they were added.
+        self._tasks = {}
+        # Run order, frozen on first use and cleared whenever the task set changes.
+        self._sequence = None
         self._task_no = 0
-        self._state = STATES[0]
+        self._state = CREATED
         self._is_composite = True
 
         self.on_create()
@@ -112,6 +116,7 @@ class DAG(Process):
         if self._task_no >= n_tasks - 1:
             raise StopIteration
         task = self._tasks.popitem()
+        self._sequence = None
         self._task_no += 1
         return task
 
@@ -125,12 +130,21 @@ class DAG(Process):
     def tasks(self) -> dict:
         return self._tasks
 
+    # -------------------------------------------------------------------------------------------- #
+    @property
+    def sequence(self) -> Tuple[Process, ...]:
+        """Returns the tasks in the order they run, built once until the task set changes."""
+        if self._sequence is None:
+            self._sequence = tuple(self._tasks.values())
+        return self._sequence
+
     # -------------------------------------------------------------------------------------------- #
     def add_task(self, task: Process) -> None:
         task.dag = self
         self._tasks[task.name] = task
+        self._sequence = None
         self._modified = datetime.now()
-        self._logger.debug(f"just added task {task.name} to {self._name}")
+        self._logger.debug("just added task %s to %s", task.name, self._name)
 
     # -------------------------------------------------------------------------------------------- #
     def get_task(self, name: str = None) -> None:
@@ -154,8 +168,9 @@ class DAG(Process):
         if task.name in self._tasks.keys():
             task.dag = self
             self._tasks[task.name] = task
+            self._sequence = None
             self._modified = datetime.now()
-            self._logger.debug(f"just updated task {task.name} in {self._name}")
+            self._logger.debug("just updated task %s in %s", task.name, self._name)
         else:
             msg = f"Task {task.name} does not exist in dag {self._name}. Did you mean add_task?"
             self._logger.error(msg)
@@ -165,6 +180,7 @@ class DAG(Process):
     def remove_task(self, name: str) -> None:
         try:
             del self._tasks[name]
+            self._sequence = None
             self._modified = datetime.now()
         except KeyError:
             msg = f"Unable to delete task. Task {name} does not exist in dag {self._name}."
@@ -213,7 +229,7 @@ class Task(Process):
         self._operator = operator
         self._dag = None
         self._is_composite = False
-        self._state = STATES[0]
+        self._state = CREATED
 
     def __str__(self) -> str:
         return f"Task Id: {self._id}\n\tName: {self._name}\n\tDescription: {self._description}\n\tState: {self._state}\n\tCreated: {self._created}\n\tModified: {self._modified}"
@@ -267,6 +283,14 @@ class Task(Process):
     def operator(self, operator: Operator) -> None:
         self._operator = operator
 
+    # -------------------------------------------------------------------------------------------- #
+    def run(self, uow: UnitOfWork, data: Any = None) -> Optional[Any]:
+        """Executes the task's operator on the data.
+
+        Returns: the operator's result, or None if the input should pass through unchanged.
+        """
+        return self._operator.execute(uow=uow, data=data)
+
     # -------------------------------------------------------------------------------------------- #
     def as_dto(self) -> TaskDTO:
         return TaskDTO(
@@ -29,10 +29,14 @@ from mlops_lab.core.repo.uow import UnitOfWork
 class Operator(ABC):
     """Operator Base Class"""
 
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._logger = logging.getLogger(f"{cls.__module__}.{cls.__name__}")
+
     def __init__(self, *args, **kwargs) -> None:
-        self._logger = logging.getLogger(
-            f"{self.__module__}.{self.__class__.__name__}",
-        )
+        pass
 
     def __str__(self) -> str:
         return f"Operator:\n\tModule: {self.__module__}\n\tClass: {self.__class__.__name__}"
@@ -42,4 +46,9 @@ class Operator(ABC):
 
     @abstractmethod
     def execute(self, uow: UnitOfWork, data: Any = None) -> None:
-        """Executes the operation."""
+        """Executes the operation.
+
+        Returns the data for the next task, or None to pass data through as is. An operator
+        may modify data in place and return None to hand it on without a copy; such operators
+        must not run concurrently over the same data.
+        """
@@ -18,7 +18,6 @@
 # ================================================================================================ #
 """Loader Module."""
 from typing import Any
-from types import SimpleNamespace
 
 from dependency_injector.wiring import Provide, inject
 from dependency_injector import containers
@@ -43,13 +42,13 @@ class DataSourceLoader(Operator):
 
     """
 
+    __slots__ = ("_datasource", "_factory")
+
     @inject
     def __init__(
         self, config: dict, factory: containers.DeclarativeContainer = Provide[mlops_lab.factory]
     ) -> None:
         super().__init__()
-        datasource = SimpleNamespace(**config["datasource"])
-        setattr(self, "datasource", datasource)
         self._datasource = config["datasource"]
         self._factory = factory
 
@@ -64,7 +63,7 @@ class DataSourceLoader(Operator):
     def _build_datasource(self) -> DataSource:
         """Constructs the DataSource object."""
         datasource = self._factory.datasource()(**self._datasource)
-        for urlconfig in self._datasource.urls:
+        for urlconfig in self._datasource["urls"]:
             url = self._factory.datasource_url()(**urlconfig)
             datasource.add_url(url)
         return datasource
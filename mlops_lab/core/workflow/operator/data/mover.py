@@ -17,13 +17,26 @@
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 """Data Mover Module"""
-import urllib
-from zipfile import ZipFile
-from typing import Any
+import os
+import shutil
+import tempfile
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import repeat
+from zipfile import ZipFile, ZipInfo
+from typing import IO, Any, Callable, List, Optional
 
 from mlops_lab.core.workflow.operator.base import Operator
 from mlops_lab.core.repo.uow import UnitOfWork
 
+# ------------------------------------------------------------------------------------------------ #
+CHUNK_SIZE = 1 << 20  # Bytes copied per read from the network stream.
+MAX_RETRIES = 3  # Further attempts made after a transient download failure.
+BACKOFF = 1.0  # Seconds before the first retry, doubling on each subsequent one.
+
 
 # ------------------------------------------------------------------------------------------------ #
 #                                  DOWNLOAD EXTRACTOR ZIP                                          #
@@ -36,6 +49,10 @@ class DownloadZipExtract(Operator):
         destination (str): A directory into which the ZipFile contents will be extracted.
     """
 
+    # Archive suffixes, matched against the URL path, mapped to the method that unpacks them.
+    # URLs matching no suffix are treated as zip archives.
+    _EXTRACTORS = {".zip": "_extract_zip"}
+
     def __init__(self, name: str, destination: str) -> None:
         super().__init__()
         self._name = name
@@ -46,19 +63,130 @@ class DownloadZipExtract(Operator):
         # Obtain the datasource urls
         repo = uow.get_repo("datasource")
         datasource = repo.get_by_name(self._name)
-        # Iterate through the URLs
-        for url in datasource.urls.values():
-            zipresp = urllib.request.urlopen(url["url"])
-            # Create a new file on the hard drive
-            tempzip = open("/tmp/tempfile.zip", "wb")
-            # Write the contents of the downloaded file into the new file
-            tempzip.write(zipresp.read())
-            # Close the newly-created file
-            tempzip.close()
-            # Re-open the newly-created file with ZipFile()
-            zf = ZipFile("/tmp/tempfile.zip")
-            # Extract its contents into <extraction_path>
-            # note that extractall will automatically create the path
-            zf.extractall(path=self._destination)
-            # close the ZipFile instance
-            zf.close()
+        urls = [url.url for url in datasource.urls.values()]
+        if not urls:
+            return
+        # Download the next archive while the current one is extracted. Overlap is per archive:
+        # a zip's central directory sits at its end, so no member can be inflated mid-download.
+        with ThreadPoolExecutor(max_workers=1) as downloader:
+            pending = downloader.submit(self._download, urls[0])
+            try:
+                for url, next_url in zip(urls, urls[1:] + [None]):
+                    spool = pending.result()
+                    pending = downloader.submit(self._download, next_url) if next_url else None
+                    with spool:
+                        self._get_extractor(url)(spool)
+            finally:
+                # A failed extraction leaves the prefetch in flight; its file must still close.
+                if pending is not None and not pending.cancel():
+                    self._discard(pending)
+
+    @staticmethod
+    def _discard(download: Future) -> None:
+        """Waits for an unneeded download and closes its file, if it produced one."""
+        if download.exception() is None:
+            download.result().close()
+
+    def _get_extractor(self, url: str) -> Callable[[IO[bytes]], None]:
+        """Returns the method that unpacks archives of the url's type."""
+        path = urllib.parse.urlparse(url).path.lower()
+        for suffix, extractor in self._EXTRACTORS.items():
+            if path.endswith(suffix):
+                return getattr(self, extractor)
+        return self._extract_zip
+
+    def _download(self, url: str) -> IO[bytes]:
+        """Streams the archive into a temporary file, rewound and ready to read.
+
+        A plain TemporaryFile rather than a SpooledTemporaryFile: ZipFile needs seekable(), which
+        SpooledTemporaryFile lacks before Python 3.11.
+        """
+        spool = tempfile.TemporaryFile()
+        try:
+            for attempt in range(MAX_RETRIES + 1):
+                try:
+                    with urllib.request.urlopen(url) as response:
+                        shutil.copyfileobj(response, spool, length=CHUNK_SIZE)
+                    break
+                except (urllib.error.URLError, ConnectionError) as e:
+                    if attempt == MAX_RETRIES or not self._is_transient(e):
+                        raise
+                    delay = self._retry_delay(e, attempt)
+                    self._logger.warning(
+                        "Download of %s failed (%s), retrying in %ss.", url, e, delay
+                    )
+                    time.sleep(delay)
+                    spool.seek(0)
+                    spool.truncate()
+        except BaseException:
+            spool.close()
+            raise
+        spool.seek(0)
+        return spool
+
+    @staticmethod
+    def _is_transient(error: OSError) -> bool:
+        """Rate limiting, server errors and connection failures are worth retrying."""
+        if isinstance(error, urllib.error.HTTPError):
+            return error.code == 429 or error.code >= 500
+        return True
+
+    @staticmethod
+    def _retry_delay(error: OSError, attempt: int) -> float:
+        """Honors a numeric Retry-After header, otherwise backs off exponentially."""
+        retry_after = getattr(error, "headers", None) and error.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        return BACKOFF * 2**attempt
+
+    def _extract_zip(self, archive: IO[bytes]) -> None:
+        """Extracts the zip archive members concurrently.
+
+        Inflation runs outside the GIL and ZipFile serializes the underlying reads, so members
+        decompress in parallel over a single handle.
+        """
+        with ZipFile(archive) as zf, ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            members = zf.infolist()
+            self._make_parent_dirs(members)
+            list(executor.map(self._extract_member, repeat(zf), members))
+
+    def _make_parent_dirs(self, members: List[ZipInfo]) -> None:
+        """Creates each distinct parent directory once, before the workers start.
+
+        Workers then find their directories in place rather than each repeating the existence
+        check and racing one another to create shared parents.
+        """
+        targets = (self._target(member) for member in members)
+        for directory in sorted({os.path.dirname(target) for target in targets if target}):
+            os.makedirs(directory, exist_ok=True)
+
+    def _extract_member(self, zf: ZipFile, member: ZipInfo) -> None:
+        if self._is_extracted(member):
+            return
+        try:
+            zf.extract(member, path=self._destination)
+        except FileExistsError:
+            # A parent not created up front (a name ZipFile sanitizes differently) was made by
+            # another worker between ZipFile's existence check and its makedirs; retry once.
+            zf.extract(member, path=self._destination)
+
+    def _is_extracted(self, member: ZipInfo) -> bool:
+        """Returns True if a file of the member's size already exists at its target path.
+
+        Re-running the operator then skips inflating members that are already in place. Names
+        that would not resolve inside the destination are always handed to ZipFile, which
+        sanitizes them.
+        """
+        target = None if member.is_dir() else self._target(member)
+        if target is None:
+            return False
+        try:
+            return os.path.getsize(target) == member.file_size
+        except OSError:
+            return False
+
+    def _target(self, member: ZipInfo) -> Optional[str]:
+        """Returns the member's path under the destination, or None if it would fall outside."""
+        root = os.path.abspath(self._destination)
+        target = os.path.abspath(os.path.join(root, member.filename))
+        return target if os.path.commonpath([root, target]) == root else None
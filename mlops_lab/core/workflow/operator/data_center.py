@@ -21,6 +21,7 @@ from types import SimpleNamespace
 import pandas as pd
 
 from .base import Operator
+from .groupby import broadcast_group_means
 from mlops_lab.core.entity.dataset import Dataset
 
 
@@ -79,8 +80,10 @@ class DataCenter(Operator):
     def _execute(self, data: pd.DataFrame) -> pd.DataFrame:
         """Returns the centered Dataset object."""
 
+        # Setting a new column appends a block without copying the existing ones, whereas
+        # DataFrame.assign would copy the entire frame first.
         data[self._out_var] = data[self._var].sub(
-            data.groupby(self._group_var)[self._var].transform("mean")
+            broadcast_group_means(keys=data[self._group_var], values=data[self._var])
         )
 
         dataset = self._build_dataset(data=data)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /mlops_lab/core/workflow/operator/groupby.py                                        #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Thursday October 15th 2026 02:10:00 pm                                              #
+# Modified   : Thursday October 15th 2026 02:10:00 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Vectorized Group Aggregation Module
+
+Factorizations are computed per call rather than memoized across operators. Each operator loads
+its input afresh from the Dataset repository, so consecutive operators never share a DataFrame
+object. A cache keyed on the frame would also go stale silently: pandas carries attrs over to
+slices and copies, and columns can be reassigned in place.
+"""
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# ------------------------------------------------------------------------------------------------ #
+def group_means(
+    keys: pd.Series, values: pd.Series, sort: bool = False
+) -> Tuple[np.ndarray, pd.Index, np.ndarray]:
+    """Computes the mean of values within each group of keys in a single vectorized pass.
+
+    Equivalent to groupby(keys)[values].mean(): missing values are skipped, rows with a missing
+    key belong to no group, and a group without any non-missing value has a mean of NaN.
+
+    Args:
+        keys (pd.Series): The grouping variable.
+        values (pd.Series): The numeric variable to average.
+        sort (bool): Orders the groups by key if True, otherwise by first appearance.
+
+    Returns: a tuple of the per-row group codes (-1 for a missing key), the group keys, and the
+        mean of each group.
+    """
+    codes, uniques = pd.factorize(keys, sort=sort)
+    group_codes = codes
+    values = _as_float_array(values)
+    valid = (codes >= 0) & ~np.isnan(values)
+    # Compact only when something is missing; complete columns feed bincount without copies.
+    if not valid.all():
+        group_codes, values = codes[valid], values[valid]
+    sums = np.bincount(group_codes, weights=values, minlength=len(uniques))
+    counts = np.bincount(group_codes, minlength=len(uniques))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts
+    return codes, uniques, means
+
+
+# ------------------------------------------------------------------------------------------------ #
+def _as_float_array(values: pd.Series) -> np.ndarray:
+    """Returns the values as a floating point array with NaN for missing values.
+
+    NumPy float columns (float32 included) are returned as-is rather than upcast, since bincount
+    accumulates in float64 regardless; integer and nullable columns are converted to float64.
+    """
+    if values.dtype.kind == "f" and isinstance(values.dtype, np.dtype):
+        return values.to_numpy()
+    return values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+# ------------------------------------------------------------------------------------------------ #
+def broadcast_group_means(keys: pd.Series, values: pd.Series) -> np.ndarray:
+    """Returns each row's group mean, as groupby(keys)[values].transform("mean") would."""
+    # Sorted keys (e.g. output of an earlier groupby) form contiguous runs that reduce in one
+    # streaming pass. is_monotonic_increasing is False whenever a key is missing.
+    if len(keys) and keys.is_monotonic_increasing:
+        return _broadcast_sorted_group_means(keys, values)
+    codes, _, means = group_means(keys, values)
+    # The trailing NaN is what code -1 (a missing key) selects.
+    return np.append(means, np.nan)[codes]
+
+
+# ------------------------------------------------------------------------------------------------ #
+def _broadcast_sorted_group_means(keys: pd.Series, values: pd.Series) -> np.ndarray:
+    """Returns each row's group mean for keys sorted in ascending order, without factorizing."""
+    k = keys.to_numpy()
+    starts = np.flatnonzero(np.r_[True, k[1:] != k[:-1]])
+    sizes = np.diff(np.r_[starts, len(k)])
+    values = _as_float_array(values)
+    valid = ~np.isnan(values)
+    if valid.all():
+        sums = np.add.reduceat(values, starts, dtype=np.float64)
+        counts = sizes
+    else:
+        sums = np.add.reduceat(np.where(valid, values, 0), starts, dtype=np.float64)
+        counts = np.add.reduceat(valid, starts, dtype=np.intp)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts
+    return np.repeat(means, sizes)
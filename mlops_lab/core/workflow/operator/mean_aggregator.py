@@ -21,6 +21,7 @@ from types import SimpleNamespace
 import pandas as pd
 
 from .base import Operator
+from .groupby import group_means
 from mlops_lab.core.entity.dataset import Dataset
 
 
@@ -74,8 +75,10 @@ class MeanAggregator(Operator):
 
     def _execute(self, data=pd.DataFrame) -> Dataset:
         """Aggregates the data and computes the mean by the grouping variable."""
-        data = data.groupby(self._group_var)[self._var].mean().reset_index()
-        data.columns = [self._group_var, self._out_var]
+        _, groups, means = group_means(
+            keys=data[self._group_var], values=data[self._var], sort=True
+        )
+        data = pd.DataFrame({self._group_var: groups, self._out_var: means})
 
         dataset = self._build_dataset(data=data)
 
@@ -17,12 +17,16 @@
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 from types import SimpleNamespace
+from typing import Iterator, Tuple
 import pandas as pd
 import numpy as np
 
 from .base import Operator
 from mlops_lab.core.entity.dataset import Dataset
 
+# Sample fractions below which sparse sampling draws clusters by rejection, not a full permutation.
+SPARSE_FRAC = 0.1
+
 # ------------------------------------------------------------------------------------------------ #
 #                                          SAMPLER                                                 #
 # ------------------------------------------------------------------------------------------------ #
@@ -48,6 +52,9 @@ class Sampler(Operator):
             replace (bool): Whether to sample with replacement. Default = False.
             shuffle (bool): Whether to shuffle before sampling. Default = True.
             random_state (int): The pseudo random seed for reproducibility.
+            sparse (bool): Draw small cluster samples by rejection rather than a full
+                permutation. Faster, but selects different clusters for a given random_state
+                than the default path. Default = False.
     """
 
     def __init__(
@@ -65,12 +72,13 @@ class Sampler(Operator):
             description=self._task_params.description,
         )
 
-        self._cluster = operator_params.cluster
-        self._cluster_by = operator_params.cluster_by
-        self._frac = operator_params.frac
-        self._replace = operator_params.replace
-        self._shuffle = operator_params.shuffle
-        self._random_state = operator_params.random_state
+        self._cluster = self._operator_params.cluster
+        self._cluster_by = self._operator_params.cluster_by
+        self._frac = self._operator_params.frac
+        self._replace = self._operator_params.replace
+        self._shuffle = self._operator_params.shuffle
+        self._random_state = self._operator_params.random_state
+        self._sparse = getattr(self._operator_params, "sparse", False)
 
     def execute(self, *args, **kwargs) -> None:
         """Executes the operation on the DataFrame object"""
@@ -90,30 +98,93 @@ class Sampler(Operator):
             data = data.sample(frac=self._frac, random_state=self._random_state)
         return data
 
+    def sample_many(self, data: pd.DataFrame, n_samples: int) -> Iterator[pd.DataFrame]:
+        """Yields n_samples independent cluster samples of the data.
+
+        The cluster column is factorized once for all replicates, so each additional sample costs
+        only the cluster draw and a positional take, as in bootstrap or resampling workflows.
+
+        Args:
+            data (pd.DataFrame): The data to sample.
+            n_samples (int): The number of samples to produce.
+        """
+        self._validate_frac()
+        rng = np.random.default_rng(self._random_state)
+        codes, n_clusters = self._factorize(data)
+        for _ in range(n_samples):
+            yield data if self._frac == 1 else data.take(self._select_rows(rng, codes, n_clusters))
+
     def _sample_by_cluster(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Returns a sample of clusters."""
+        """Returns a sample of clusters.
+
+        Rows are gathered by a single membership pass rather than from a frame pre-sorted by
+        cluster: each execution loads a fresh frame, so the sort would never be reused and its
+        O(n log n) cost would exceed the gather it replaces.
+        """
+        self._validate_frac()
         if self._frac == 1:
             return data
-        elif self._frac > 1:
+
+        rng = np.random.default_rng(self._random_state)
+        codes, n_clusters = self._factorize(data)
+        sample = data.take(self._select_rows(rng, codes, n_clusters))
+        return self._build_dataset(data=sample)
+
+    def _validate_frac(self) -> None:
+        if self._frac > 1:
             msg = "The frac parameter must be in (0,1]"
             self._logger.error(msg)
             raise ValueError(msg)
 
-        rng = np.random.default_rng(self._random_state)
-
+    def _factorize(self, data: pd.DataFrame) -> Tuple[np.ndarray, int]:
+        """Returns the per-row cluster codes and the number of clusters."""
         try:
-            clusters = data[self._cluster_by].unique()
-            n_clusters = len(clusters)
-            size = int(n_clusters * self._frac)
-            sample_clusters = rng.choice(
-                a=clusters, size=size, replace=self._replace, shuffle=self._shuffle
-            )
-            sample = data.loc[data[self._cluster_by].isin(sample_clusters)]
-            return self._build_dataset(data=sample)
+            # Codes index the clusters in order of first appearance, as unique() would.
+            codes, clusters = pd.factorize(data[self._cluster_by], use_na_sentinel=False)
         except KeyError:
             msg = "The dataframe has no column {}".format(self._cluster_by)
             self._logger.error(msg)
             raise KeyError(msg)
+        return codes, len(clusters)
+
+    def _select_rows(
+        self, rng: np.random.Generator, codes: np.ndarray, n_clusters: int
+    ) -> np.ndarray:
+        """Draws a sample of clusters and returns the positions of their rows."""
+        size = int(n_clusters * self._frac)
+        if self._sparse and not self._replace and size < n_clusters * SPARSE_FRAC:
+            chosen = self._choose_sparse(rng, n_clusters, size)
+        else:
+            sample_clusters = rng.choice(
+                a=n_clusters, size=size, replace=self._replace, shuffle=self._shuffle
+            )
+            chosen = np.zeros(n_clusters, dtype=bool)
+            chosen[sample_clusters] = True
+        # ndarray.take skips the general fancy-indexing machinery for the per-row lookup.
+        return np.flatnonzero(chosen.take(codes))
+
+    @staticmethod
+    def _choose_sparse(rng: np.random.Generator, n_clusters: int, size: int) -> np.ndarray:
+        """Marks size distinct clusters, drawn uniformly without replacement, in a boolean mask.
+
+        choice(replace=False) permutes all n_clusters, which dominates when few are wanted.
+        Draws with replacement, rejecting clusters already chosen, are equivalent and need only
+        O(size) random numbers while the fraction chosen stays small. The mask itself is still
+        O(n_clusters), as is the per-row lookup that consumes it. For a given seed the clusters
+        drawn differ from those of choice, so the path is opt-in via the sparse parameter.
+        """
+        chosen = np.zeros(n_clusters, dtype=bool)
+        remaining = size
+        while remaining:
+            draws = rng.integers(0, n_clusters, size=2 * remaining)
+            # Keep the first occurrence of each draw, in draw order, then drop clusters already
+            # chosen so the selection matches sequential sampling without replacement.
+            _, first = np.unique(draws, return_index=True)
+            draws = draws[np.sort(first)]
+            fresh = draws[~chosen[draws]][:remaining]
+            chosen[fresh] = True
+            remaining -= len(fresh)
+        return chosen
 
     def _build_dataset(self, data: pd.DataFrame) -> None:
         dataset = Dataset(
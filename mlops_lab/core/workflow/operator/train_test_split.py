@@ -16,7 +16,9 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
+import math
 from types import SimpleNamespace
+from typing import Tuple
 import pandas as pd
 
 from .base import Operator
@@ -80,18 +82,28 @@ class TrainTestSplit(Operator):
 
     def _execute(self, data: pd.DataFrame) -> pd.DataFrame:
         """Returns a Dataset containing Training and Test DataFrame objects."""
-
-        sorted_data = data.sort_values(by=self._split_var, ascending=True).reset_index()
-        train_idx = sorted_data.index < sorted_data.shape[0] * self._train_size
-        test_idx = sorted_data.index >= sorted_data.shape[0] * self._train_size
-
-        train = sorted_data[train_idx]
-        test = sorted_data[test_idx]
-
+        train, test = self._split(data)
         dataset = self._build_dataset(train, test)
 
         return dataset
 
+    def _split(self, data: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Splits the data, sorted by the split variable, into training and test frames."""
+        # Sorting the split column alone and gathering each split positionally avoids
+        # materializing a fully sorted copy of the frame before slicing it. Series.sort_values
+        # places missing values last and handles object and nullable dtypes, as the frame sort did.
+        order = data[self._split_var].reset_index(drop=True).sort_values(kind="stable").index
+        order = order.to_numpy()
+        # Rows whose position falls below n * train_size form the training set.
+        n = len(order)
+        cut = math.ceil(n * self._train_size)
+
+        train = data.take(order[:cut]).reset_index()
+        test = data.take(order[cut:]).reset_index()
+        test.index = pd.RangeIndex(cut, n)
+
+        return train, test
+
     def _build_dataset(self, train: pd.DataFrame, test: pd.DataFrame) -> Dataset:
         """Constructs the output Dataset."""
         dataset = Dataset(
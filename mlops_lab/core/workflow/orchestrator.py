@@ -97,15 +97,19 @@ class SyncOrchestrator(Orchestrator):
         data = None
 
         with self._uow as uow:
-            task = next(self._dag)
-            try:
-                task.on_start()
-                data = task.run(uow=uow, data=data)
-                task.on_end()
-            except Exception:  # pragma: no cover
-                task.on_fail()
-                self.on_fail()
-                raise
+            for task in self._dag.sequence:
+                run = task.run
+                try:
+                    task.on_start()
+                    result = run(uow=uow, data=data)
+                    task.on_end()
+                except Exception:  # pragma: no cover
+                    task.on_fail()
+                    self.on_fail()
+                    raise
+                # Tasks returning None pass their input through; empty results are still results.
+                if result is not None:
+                    data = result
 
         self.on_end()
         return data
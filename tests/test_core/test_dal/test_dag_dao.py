@@ -16,7 +16,7 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
-import inspect
+import sys
 from datetime import datetime
 import pytest
 import logging
@@ -41,7 +41,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -60,7 +60,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -75,7 +75,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\n\tStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -99,7 +99,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -112,7 +112,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -136,7 +136,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -150,7 +150,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -168,7 +168,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -182,7 +182,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -206,7 +206,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -220,7 +220,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -239,7 +239,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -253,7 +253,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -276,7 +276,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -290,7 +290,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -311,7 +311,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -325,7 +325,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -341,7 +341,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -355,7 +355,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -372,7 +372,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -386,7 +386,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -405,7 +405,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -419,7 +419,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -436,7 +436,7 @@ class TestDAGDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -16,7 +16,7 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
-import inspect
+import sys
 from datetime import datetime
 import pytest
 import logging
@@ -41,7 +41,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -60,7 +60,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -75,7 +75,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\n\tStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -99,7 +99,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -112,7 +112,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -138,7 +138,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -152,7 +152,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -170,7 +170,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -184,7 +184,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -210,7 +210,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -224,7 +224,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -243,7 +243,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -257,7 +257,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -280,7 +280,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -294,7 +294,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -315,7 +315,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -329,7 +329,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -345,7 +345,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -359,7 +359,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -376,7 +376,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -390,7 +390,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -409,7 +409,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -423,7 +423,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -440,7 +440,7 @@ class TestDatasetDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -16,7 +16,7 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
-import inspect
+import sys
 from datetime import datetime
 import pytest
 import logging
@@ -41,7 +41,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -60,7 +60,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -75,7 +75,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\n\tStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -99,7 +99,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -112,7 +112,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -137,7 +137,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -151,7 +151,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -169,7 +169,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -183,7 +183,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -208,7 +208,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -222,7 +222,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -241,7 +241,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -255,7 +255,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -278,7 +278,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -292,7 +292,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -313,7 +313,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -327,7 +327,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -343,7 +343,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -357,7 +357,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -374,7 +374,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -388,7 +388,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -407,7 +407,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
@@ -421,7 +421,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\nStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -438,7 +438,7 @@ class TestDataSourceURLDAO:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),
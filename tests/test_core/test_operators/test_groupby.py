@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /tests/test_core/test_operators/test_groupby.py                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Thursday October 15th 2026 06:15:00 pm                                              #
+# Modified   : Thursday October 15th 2026 06:15:00 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import sys
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+import pandas as pd
+
+from mlops_lab.core.workflow.operator.groupby import broadcast_group_means, group_means
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+NAN = np.nan
+CASES = {
+    "complete": ([3, 1, 3, 2, 1], [1.0, 2.0, 3.0, 4.0, 5.0]),
+    "nan_keys": ([3, NAN, 3, 2, NAN], [1.0, 2.0, 3.0, 4.0, 5.0]),
+    "nan_values": ([3, 1, 3, 2, 1], [1.0, NAN, 3.0, 4.0, 5.0]),
+    "all_nan_group": ([3, 1, 3, 2, 1], [1.0, NAN, 3.0, 4.0, NAN]),
+    "integer_values": ([3, 1, 3, 2, 1], [1, 2, 3, 4, 5]),
+    "nullable_values": ([3, 1, 3, 2, 1], pd.array([1, None, 3, 4, 5], dtype="Int64")),
+}
+
+
+# ------------------------------------------------------------------------------------------------ #
+def cases(dtype=None):
+    for keys, values in CASES.values():
+        yield pd.Series(keys), pd.Series(values, dtype=dtype) if dtype else pd.Series(values)
+
+
+@pytest.mark.groupby
+class TestGroupBy:  # pragma: no cover
+    # ============================================================================================ #
+    def test_group_means(self):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                sys._getframe().f_code.co_name,
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        for keys, values in cases():
+            for sort in (False, True):
+                expected = values.astype("float64").groupby(keys, sort=sort).mean()
+                codes, groups, means = group_means(keys=keys, values=values, sort=sort)
+                assert len(codes) == len(keys)
+                assert (codes[keys.isna().to_numpy()] == -1).all()
+                assert list(groups) == list(expected.index)
+                np.testing.assert_allclose(means, expected.to_numpy())
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                sys._getframe().f_code.co_name,
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_group_means_float32(self):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                sys._getframe().f_code.co_name,
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        for keys, values in list(cases("float32"))[:4]:
+            expected = values.groupby(keys).mean()
+            _, groups, means = group_means(keys=keys, values=values, sort=True)
+            assert list(groups) == list(expected.index)
+            np.testing.assert_allclose(means, expected.to_numpy(), rtol=1e-6)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                sys._getframe().f_code.co_name,
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_broadcast_group_means(self):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                sys._getframe().f_code.co_name,
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        for keys, values in cases():
+            # Sorting the keys exercises the contiguous reduceat path where no key is missing.
+            order = keys.sort_values(kind="stable").index
+            for k, v in ((keys, values), (keys[order], values[order])):
+                k, v = k.reset_index(drop=True), v.reset_index(drop=True)
+                expected = v.astype("float64").groupby(k).transform("mean")
+                np.testing.assert_allclose(
+                    broadcast_group_means(keys=k, values=v), expected.to_numpy()
+                )
+
+        for keys, values in list(cases("float32"))[:4]:
+            expected = values.groupby(keys).transform("mean")
+            np.testing.assert_allclose(
+                broadcast_group_means(keys=keys, values=values), expected.to_numpy(), rtol=1e-6
+            )
+
+        empty = pd.Series([], dtype="float64")
+        assert len(broadcast_group_means(keys=empty, values=empty)) == 0
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                sys._getframe().f_code.co_name,
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
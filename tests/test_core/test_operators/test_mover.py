@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /tests/test_core/test_operators/test_mover.py                                       #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Thursday October 15th 2026 04:30:00 pm                                              #
+# Modified   : Thursday October 15th 2026 04:30:00 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import io
+import sys
+from datetime import datetime
+from zipfile import ZipFile
+import pytest
+import logging
+
+from mlops_lab.core.workflow.operator.data.mover import DownloadZipExtract
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+MEMBERS = {"ratings.csv": b"userId,movieId,rating\n1,1,4.0\n", "links/links.csv": b"movieId\n1\n"}
+
+
+@pytest.mark.mover
+class TestDownloadZipExtract:  # pragma: no cover
+    # ============================================================================================ #
+    def test_download_extract(self, tmp_path, monkeypatch):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                sys._getframe().f_code.co_name,
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        buffer = io.BytesIO()
+        with ZipFile(buffer, "w") as zf:
+            for name, content in MEMBERS.items():
+                zf.writestr(name, content)
+        archive = tmp_path / "archive.zip"
+        archive.write_bytes(buffer.getvalue())
+        destination = tmp_path / "extract"
+
+        mover = DownloadZipExtract(name="test", destination=str(destination))
+        with mover._download(archive.as_uri()) as spool:
+            assert spool.seekable()
+            mover._extract_zip(spool)
+
+        for name, content in MEMBERS.items():
+            assert (destination / name).read_bytes() == content
+
+        # Re-running skips members already in place: none is extracted or rewritten.
+        stats = {name: (destination / name).stat() for name in MEMBERS}
+        extracted = []
+        monkeypatch.setattr(
+            ZipFile, "extract", lambda zf, member, **kwargs: extracted.append(member)
+        )
+        with mover._download(archive.as_uri()) as spool:
+            mover._extract_zip(spool)
+        assert extracted == []
+        for name, stat in stats.items():
+            restat = (destination / name).stat()
+            assert (restat.st_ino, restat.st_mtime_ns) == (stat.st_ino, stat.st_mtime_ns)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                sys._getframe().f_code.co_name,
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
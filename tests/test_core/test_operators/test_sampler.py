@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /tests/test_core/test_operators/test_sampler.py                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Thursday October 15th 2026 06:00:00 pm                                              #
+# Modified   : Thursday October 15th 2026 06:00:00 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import sys
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+import pandas as pd
+
+from mlops_lab.core.workflow.operator.sampler import Sampler
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+TASK_PARAMS = {"name": "sample", "mode": "test", "description": "Samples the data."}
+OPERATOR_PARAMS = {
+    "cluster": True,
+    "cluster_by": "userId",
+    "frac": 0.05,
+    "replace": False,
+    "shuffle": True,
+    "random_state": 55,
+}
+
+
+@pytest.mark.sampler
+class TestSampler:  # pragma: no cover
+    # ============================================================================================ #
+    def test_choose_sparse(self):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                sys._getframe().f_code.co_name,
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(55)
+        for n_clusters, size in ((1000, 0), (1000, 1), (1000, 99), (10, 10), (7, 3)):
+            chosen = Sampler._choose_sparse(rng, n_clusters, size)
+            assert chosen.dtype == bool
+            assert len(chosen) == n_clusters
+            assert chosen.sum() == size
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                sys._getframe().f_code.co_name,
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_sample_many(self):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                sys._getframe().f_code.co_name,
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = pd.DataFrame({"userId": np.repeat(np.arange(200), 3), "rating": np.arange(600)})
+        for sparse in (False, True):
+            sampler = Sampler(
+                task_params=TASK_PARAMS,
+                operator_params={**OPERATOR_PARAMS, "sparse": sparse},
+                input_params={},
+                output_params={},
+            )
+            samples = list(sampler.sample_many(data, n_samples=3))
+            assert len(samples) == 3
+            for sample in samples:
+                # Each sample holds every row of exactly frac of the clusters.
+                assert sample["userId"].nunique() == 10
+                assert len(sample) == 30
+                pd.testing.assert_frame_equal(sample, data[data["userId"].isin(sample["userId"])])
+            assert not samples[0].equals(samples[1])
+
+            # Replicates are reproducible from the random state.
+            again = list(sampler.sample_many(data, n_samples=3))
+            for sample, repeat in zip(samples, again):
+                pd.testing.assert_frame_equal(sample, repeat)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                sys._getframe().f_code.co_name,
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
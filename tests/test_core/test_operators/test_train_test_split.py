@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /tests/test_core/test_operators/test_train_test_split.py                            #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Thursday October 15th 2026 06:30:00 pm                                              #
+# Modified   : Thursday October 15th 2026 06:30:00 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import sys
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+import pandas as pd
+
+from mlops_lab.core.workflow.operator.train_test_split import TrainTestSplit
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+TASK_PARAMS = {"name": "split", "mode": "test", "description": "Splits the data."}
+SPLIT_VARS = {
+    "float": [3.0, np.nan, 1.0, 2.0, 1.0, np.nan, 5.0],
+    "object": ["c", None, "a", "b", "a", None, "e"],
+    "nullable": pd.array([3, None, 1, 2, 1, None, 5], dtype="Int64"),
+}
+
+
+@pytest.mark.split
+class TestTrainTestSplit:  # pragma: no cover
+    # ============================================================================================ #
+    def test_split(self):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                sys._getframe().f_code.co_name,
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        for train_size in (0.5, 0.8):
+            operator = TrainTestSplit(
+                task_params=TASK_PARAMS,
+                operator_params={"split_var": "timestamp", "train_size": train_size},
+                input_params={},
+                output_params={},
+                train_params={},
+                test_params={},
+            )
+            for split_var in SPLIT_VARS.values():
+                data = pd.DataFrame(
+                    {"timestamp": split_var, "rating": range(7)}, index=range(10, 17)
+                )
+                # Splitting the fully sorted frame is the reference behaviour.
+                expected = data.sort_values(by="timestamp", kind="stable").reset_index()
+                is_train = expected.index < len(expected) * train_size
+
+                train, test = operator._split(data)
+                pd.testing.assert_frame_equal(train, expected[is_train])
+                pd.testing.assert_frame_equal(test, expected[~is_train])
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                sys._getframe().f_code.co_name,
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
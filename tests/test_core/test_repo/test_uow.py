@@ -16,7 +16,7 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
-import inspect
+import sys
 from datetime import datetime
 import pytest
 import logging
@@ -32,125 +32,87 @@ logger = logging.getLogger(__name__)
 # ------------------------------------------------------------------------------------------------ #
 double_line = f"\n{100 * '='}"
 single_line = f"\n{100 * '-'}"
+TIME_FORMAT = "%I:%M:%S %p on %m/%d/%Y"
+
+
+def _reset(container) -> UnitOfWork:
+    container.dba.file().reset()
+    container.dba.object().reset()
+    return container.work.unit()
+
+
+@pytest.fixture(scope="class")
+def class_uow(container) -> UnitOfWork:
+    """Unit of work over stores reset once for the class, for tests that only read."""
+    return _reset(container)
+
+
+@pytest.fixture
+def fresh_uow(container) -> UnitOfWork:
+    """Unit of work over freshly reset stores, for tests that write and assert on ids."""
+    return _reset(container)
 
 
 @pytest.mark.uow
 class TestUOW:  # pragma: no cover
-    # ============================================================================================ #
-    def test_reset(self, container) -> UnitOfWork:
-        dba = container.dba.file()
-        dba.reset()
-        dba = container.dba.object()
-        dba.reset()
-        uow = container.work.unit()
-        assert isinstance(uow, UnitOfWork)
-        return uow
-
-    def test_setup(self, container, caplog):
+    def _log_start(self, name: str) -> datetime:
         start = datetime.now()
         logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
+            "\n\nStarted %s %s at %s", type(self).__name__, name, start.strftime(TIME_FORMAT)
         )
         logger.info(double_line)
+        return start
+
+    def _log_end(self, name: str, start: datetime) -> None:
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+        logger.info(
+            "\n\tCompleted %s %s in %s seconds at %s",
+            type(self).__name__,
+            name,
+            duration,
+            end.strftime(TIME_FORMAT),
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_setup(self, class_uow, caplog):
+        start = self._log_start(sys._getframe().f_code.co_name)
         # ---------------------------------------------------------------------------------------- #
-        uow = self.test_reset(container)
+        uow = class_uow
+        assert isinstance(uow, UnitOfWork)
         assert isinstance(uow.get_repo("file"), Repo)
         assert isinstance(uow.get_repo("profile"), Repo)
         assert isinstance(uow.get_repo("dataset"), DatasetRepo)
         assert isinstance(uow.get_repo("datasource"), DataSourceRepo)
         assert isinstance(uow.get_repo("dag"), DAGRepo)
         # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
+        self._log_end(sys._getframe().f_code.co_name, start)
 
     # ============================================================================================ #
-    def test_file_w_rollback(self, container, files, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
+    def test_file_w_rollback(self, fresh_uow, files, caplog):
+        start = self._log_start(sys._getframe().f_code.co_name)
         # ---------------------------------------------------------------------------------------- #
-        uow = self.test_reset(container)
-        with uow as unit:
+        with fresh_uow as unit:
             repo = unit.get_repo("file")
-            for file in files:
-                repo.add(file)
+            repo.add_many(files)
 
             unit.rollback()
 
-        for i in range(1, 6):
-            assert not repo.exists(i)
+        assert repo.exists_many(range(1, 6)) == set()
 
         # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
+        self._log_end(sys._getframe().f_code.co_name, start)
 
     # ============================================================================================ #
-    def test_file_w_exit_context(self, container, files, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
+    def test_file_w_exit_context(self, fresh_uow, files, caplog):
+        start = self._log_start(sys._getframe().f_code.co_name)
         # ---------------------------------------------------------------------------------------- #
-        uow = self.test_reset(container)
-        with uow as unit:
+        with fresh_uow as unit:
             repo = unit.get_repo("file")
-            for file in files:
-                repo.add(file)
+            repo.add_many(files)
 
-        for i in range(1, 6):
-            assert repo.exists(i)
+        assert repo.exists_many(range(1, 6)) == set(range(1, 6))
 
         # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
+        self._log_end(sys._getframe().f_code.co_name, start)
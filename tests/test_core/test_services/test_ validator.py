@@ -16,7 +16,7 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
-import inspect
+import sys
 from datetime import datetime
 import pytest
 import logging
@@ -36,7 +36,7 @@ class TestValidator:  # pragma: no cover
         logger.info(
             "\n\n\tStarted {} {} at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 start.strftime("%I:%M:%S %p"),
                 start.strftime("%m/%d/%Y"),
             )
@@ -44,25 +44,25 @@ class TestValidator:  # pragma: no cover
         # ---------------------------------------------------------------------------------------- #
         with pytest.raises(ValueError):
             d = Dataset(
-                name=inspect.stack()[0][3],
+                name=sys._getframe().f_code.co_name,
                 datasource="spoti",
                 stage="extract",
-                description="Test Dataset for " + inspect.stack()[0][3],
+                description="Test Dataset for " + sys._getframe().f_code.co_name,
             )
 
         with pytest.raises(ValueError):
             d = Dataset(
-                name=inspect.stack()[0][3],
+                name=sys._getframe().f_code.co_name,
                 datasource="spotify",
                 stage="ext33",
-                description="Test Dataset for " + inspect.stack()[0][3],
+                description="Test Dataset for " + sys._getframe().f_code.co_name,
             )
 
         d = Dataset(
-            name=inspect.stack()[0][3],
+            name=sys._getframe().f_code.co_name,
             datasource="spotify",
             stage="interim",
-            description="Test Dataset for " + inspect.stack()[0][3],
+            description="Test Dataset for " + sys._getframe().f_code.co_name,
         )
         assert isinstance(d, Dataset)
 
@@ -73,7 +73,7 @@ class TestValidator:  # pragma: no cover
         logger.info(
             "\n\tCompleted {} {} in {} seconds at {} on {}".format(
                 self.__class__.__name__,
-                inspect.stack()[0][3],
+                sys._getframe().f_code.co_name,
                 duration,
                 end.strftime("%I:%M:%S %p"),
                 end.strftime("%m/%d/%Y"),